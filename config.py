@@ -7,8 +7,11 @@ config.py - Конфигурация приложения LogoMaster Pro
 """
 
 import os
+import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
 
 # =============================================================================
@@ -29,8 +32,18 @@ APP_CONFIG = {
 # НАСТРОЙКИ UI И ДИЗАЙНА
 # =============================================================================
 
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Интернирует строковые ключи таблицы
+
+    Сравнение интернированных ключей заканчивается на проверке
+    идентичности, что ускоряет dict-поиск; важно для ключей, пришедших
+    не из литералов (например, из user_settings.json).
+    """
+    return {sys.intern(key): value for key, value in mapping.items()}
+
 # Цветовая схема
-COLORS = {
+COLORS = MappingProxyType(_intern_keys({
     'primary': '#2E3440',      # Темно-серый (основной)
     'primary_dark': '#242933', # Темнее основного
     'primary_darker': '#1a1f26', # Еще темнее основного
@@ -50,19 +63,45 @@ COLORS = {
     'text_secondary': '#4C566A', # Серый текст
     'border': '#D8DEE9',       # Граница
     'hover': '#E5E9F0',        # Наведение
-}
+}))
+
+class _Colors:
+    """
+    Цвета как атрибуты со __slots__ для горячих путей UI
+
+    Чтение атрибута через слот быстрее, чем dict-поиск по строковому
+    ключу, и не допускает случайной мутации палитры.
+    """
+    __slots__ = tuple(COLORS)
+
+    def __init__(self, values):
+        for key, value in values.items():
+            setattr(self, key, value)
+
+# Быстрый доступ к палитре: C.primary вместо COLORS['primary']
+C = _Colors(COLORS)
+
+# Палитра в готовых RGB-кортежах: потребителям (PIL, numpy) не нужно
+# парсить hex-строки на горячем пути
+COLORS_RGB = MappingProxyType({
+    name: (int(value[1:3], 16), int(value[3:5], 16), int(value[5:7], 16))
+    for name, value in COLORS.items()
+})
+
+# Числовые индексы цветов для упаковки палитры в массив на стороне numpy
+COLORS_INDEX = MappingProxyType({name: i for i, name in enumerate(COLORS_RGB)})
 
 # Шрифты
-FONTS = {
+FONTS = MappingProxyType(_intern_keys({
     'default': ('Segoe UI', 9),
     'heading': ('Segoe UI', 12, 'bold'),
     'button': ('Segoe UI', 9),
     'status': ('Segoe UI', 8),
     'monospace': ('Consolas', 9),
-}
+}))
 
 # Размеры и отступы
-SIZES = {
+SIZES = MappingProxyType(_intern_keys({
     'padding': 10,
     'margin': 5,
     'button_height': 32,
@@ -71,7 +110,7 @@ SIZES = {
     'status_height': 25,
     'sidebar_width': 300,
     'preview_size': (400, 300),
-}
+}))
 
 # =============================================================================
 # НАСТРОЙКИ ОБРАБОТКИ ИЗОБРАЖЕНИЙ
@@ -103,7 +142,7 @@ IMAGE_CONFIG = {
 }
 
 # Позиции для размещения логотипа
-LOGO_POSITIONS = {
+LOGO_POSITIONS = MappingProxyType({
     'top_left': (0, 0),
     'top_center': (0.5, 0),
     'top_right': (1, 0),
@@ -113,20 +152,43 @@ LOGO_POSITIONS = {
     'bottom_left': (0, 1),
     'bottom_center': (0.5, 1),
     'bottom_right': (1, 1),
-}
+})
 
-# Названия позиций на русском
-POSITION_NAMES = {
-    'top_left': 'Верх слева',
-    'top_center': 'Верх по центру',
-    'top_right': 'Верх справа',
-    'center_left': 'Центр слева',
-    'center': 'По центру',
-    'center_right': 'Центр справа',
-    'bottom_left': 'Низ слева',
-    'bottom_center': 'Низ по центру',
-    'bottom_right': 'Низ справа',
-}
+# Предвычисленные константы позиций: числовой индекс + плоский кортеж
+# координат, чтобы горячий путь наложения логотипа не ходил по dict
+# на каждое изображение
+_POSITION_INDEX = {name: i for i, name in enumerate(LOGO_POSITIONS)}
+_POSITION_XY = tuple(LOGO_POSITIONS.values())
+
+def get_position_xy(position: str) -> Tuple[float, float]:
+    """
+    Возвращает относительные координаты позиции логотипа
+
+    Args:
+        position: Название позиции ('top_left', 'center', ...)
+
+    Returns:
+        Кортеж (rel_x, rel_y); для неизвестной позиции — 'bottom_right'
+    """
+    index = _POSITION_INDEX.get(position)
+    if index is None:
+        index = _POSITION_INDEX['bottom_right']
+    return _POSITION_XY[index]
+
+# Названия позиций на русском строятся лениво (см. __getattr__ ниже):
+# таблица нужна только UI, неграфические инструменты ее не материализуют
+def _build_position_names():
+    return MappingProxyType({
+        'top_left': 'Верх слева',
+        'top_center': 'Верх по центру',
+        'top_right': 'Верх справа',
+        'center_left': 'Центр слева',
+        'center': 'По центру',
+        'center_right': 'Центр справа',
+        'bottom_left': 'Низ слева',
+        'bottom_center': 'Низ по центру',
+        'bottom_right': 'Низ справа',
+    })
 
 # =============================================================================
 # НАСТРОЙКИ ФАЙЛОВОЙ СИСТЕМЫ
@@ -139,9 +201,17 @@ TEMP_DIR = BASE_DIR / 'temp'
 LOGS_DIR = BASE_DIR / 'logs'
 CONFIG_DIR = BASE_DIR / 'config'
 
-# Создание необходимых директорий
-for directory in [ASSETS_DIR, TEMP_DIR, LOGS_DIR, CONFIG_DIR]:
-    directory.mkdir(exist_ok=True)
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """
+    Создает директорию при первом обращении к ней
+
+    lru_cache гарантирует не более одного mkdir на путь за процесс,
+    поэтому импорт config не тратит syscalls на директории,
+    которые импортеру не нужны.
+    """
+    path.mkdir(exist_ok=True)
+    return path
 
 # Пути к файлам
 FILE_PATHS = {
@@ -230,7 +300,7 @@ HOTKEYS = {
 # СООБЩЕНИЯ И ТЕКСТЫ
 # =============================================================================
 
-MESSAGES = {
+MESSAGES = MappingProxyType(_intern_keys({
     'app_title': APP_CONFIG['title'],
     'loading': 'Загрузка...',
     'processing': 'Обработка...',
@@ -256,40 +326,55 @@ MESSAGES = {
     'logo_applied': 'Логотип применен',
     'images_saved': 'Изображения сохранены',
     'processing_complete': 'Обработка завершена',
-}
+}))
 
 # =============================================================================
 # ФУНКЦИИ КОНФИГУРАЦИИ
 # =============================================================================
 
+# Реестр секций собирается один раз при загрузке модуля —
+# get_config больше не аллоцирует dict на каждый вызов
+_CONFIG_REGISTRY = MappingProxyType({
+    'app': APP_CONFIG,
+    'colors': COLORS,
+    'fonts': FONTS,
+    'sizes': SIZES,
+    'image': IMAGE_CONFIG,
+    'performance': PERFORMANCE_CONFIG,
+    'network': NETWORK_CONFIG,
+    'ui': UI_CONFIG,
+    'hotkeys': HOTKEYS,
+    'messages': MESSAGES,
+    'paths': FILE_PATHS,
+    'logging': LOGGING_CONFIG,
+})
+
+_EMPTY_SECTION = MappingProxyType({})
+
 def get_config(section: str = None) -> Dict[str, Any]:
     """
     Получает конфигурацию приложения
-    
+
     Args:
         section: Название секции конфигурации
-        
+
     Returns:
         Словарь с настройками
     """
-    configs = {
-        'app': APP_CONFIG,
-        'colors': COLORS,
-        'fonts': FONTS,
-        'sizes': SIZES,
-        'image': IMAGE_CONFIG,
-        'performance': PERFORMANCE_CONFIG,
-        'network': NETWORK_CONFIG,
-        'ui': UI_CONFIG,
-        'hotkeys': HOTKEYS,
-        'messages': MESSAGES,
-        'paths': FILE_PATHS,
-        'logging': LOGGING_CONFIG,
-    }
-    
+    # Директории создаются только когда пути действительно запрашиваются
+    if section in (None, 'paths'):
+        for directory in (ASSETS_DIR, TEMP_DIR, LOGS_DIR, CONFIG_DIR):
+            _ensure_dir(directory)
+
     if section:
-        return configs.get(section, {})
-    return configs
+        return _CONFIG_REGISTRY.get(section, _EMPTY_SECTION)
+    return _CONFIG_REGISTRY
+
+# Значения по умолчанию для аксессоров вынесены в константы модуля,
+# чтобы не передавать литералы в .get на каждый вызов
+_COLOR_DEFAULT = '#000000'
+_FONT_DEFAULT = FONTS['default']
+_SIZE_DEFAULT = 0
 
 def get_color(color_name: str) -> str:
     """
@@ -301,7 +386,8 @@ def get_color(color_name: str) -> str:
     Returns:
         Hex код цвета
     """
-    return COLORS.get(color_name, '#000000')
+    color = COLORS.get(color_name)
+    return color if color is not None else _COLOR_DEFAULT
 
 def get_font(font_name: str) -> Tuple[str, int, str]:
     """
@@ -313,7 +399,8 @@ def get_font(font_name: str) -> Tuple[str, int, str]:
     Returns:
         Кортеж (семейство, размер, стиль)
     """
-    return FONTS.get(font_name, FONTS['default'])
+    font = FONTS.get(font_name)
+    return font if font is not None else _FONT_DEFAULT
 
 def get_size(size_name: str) -> int:
     """
@@ -325,34 +412,78 @@ def get_size(size_name: str) -> int:
     Returns:
         Размер в пикселях
     """
-    return SIZES.get(size_name, 0)
+    size = SIZES.get(size_name)
+    return size if size is not None else _SIZE_DEFAULT
+
+# Предвычисленные множества расширений: O(1) проверка вместо скана списка
+_SUPPORTED_SETS = {
+    format_type: frozenset(extensions)
+    for format_type, extensions in IMAGE_CONFIG['supported_formats'].items()
+}
+
+# Объединение всех расширений для быстрой проверки "это вообще изображение?"
+# при сканировании директорий
+_ANY_SUPPORTED_EXT = frozenset().union(*_SUPPORTED_SETS.values())
+
+# Кортежи суффиксов для str.endswith: проверка N расширений одним
+# C-вызовом, без хеширования
+_FORMAT_TUPLES = {
+    format_type: tuple(extensions)
+    for format_type, extensions in IMAGE_CONFIG['supported_formats'].items()
+}
+_ANY_EXT_TUPLE = tuple(_ANY_SUPPORTED_EXT)
+
+def is_any_image(file_path: str) -> bool:
+    """
+    Проверяет, относится ли файл к какому-либо поддерживаемому формату
+
+    Args:
+        file_path: Путь к файлу
+
+    Returns:
+        True если расширение встречается хотя бы в одной категории
+    """
+    return file_path.lower().endswith(_ANY_EXT_TUPLE)
 
 def is_supported_format(file_path: str, format_type: str = 'input') -> bool:
     """
     Проверяет, поддерживается ли формат файла
-    
+
     Args:
         file_path: Путь к файлу
         format_type: Тип формата ('input', 'output', 'logo')
-        
+
     Returns:
         True если формат поддерживается
     """
-    extension = Path(file_path).suffix.lower()
-    supported = IMAGE_CONFIG['supported_formats'].get(format_type, [])
-    return extension in supported
+    suffixes = _FORMAT_TUPLES.get(format_type)
+    if suffixes is None:
+        return False
+    return file_path.lower().endswith(suffixes)
+
+# Флаг, защищающий setup_logging от повторной пересборки обработчиков
+_LOGGER_INITIALIZED = False
 
 def setup_logging() -> logging.Logger:
     """
     Настраивает систему логирования
-    
+
+    Повторные вызовы возвращают уже настроенный логгер без
+    пересоздания обработчиков и форматтера.
+
     Returns:
         Настроенный логгер
     """
+    global _LOGGER_INITIALIZED
+
     # Создаем логгер
     logger = logging.getLogger('logomaster')
+    if _LOGGER_INITIALIZED:
+        return logger
+    _LOGGER_INITIALIZED = True
+
     logger.setLevel(LOGGING_CONFIG['level'])
-    
+
     # Очищаем существующие обработчики
     logger.handlers.clear()
     
@@ -365,6 +496,7 @@ def setup_logging() -> logging.Logger:
     # Обработчик для файла
     try:
         from logging.handlers import RotatingFileHandler
+        _ensure_dir(LOGS_DIR)
         file_handler = RotatingFileHandler(
             LOGGING_CONFIG['file_path'],
             maxBytes=LOGGING_CONFIG['max_file_size'],
@@ -383,15 +515,24 @@ def setup_logging() -> logging.Logger:
     
     return logger
 
-# Инициализация логгера
-logger = setup_logging()
+def __getattr__(name: str):
+    """
+    Ленивая инициализация логгера (PEP 562)
+
+    Логгер создается только при первом обращении, поэтому импортеры,
+    которым нужны лишь таблицы настроек (например debug_colors.py),
+    не платят за инициализацию logging и открытие файла лога.
+    """
+    if name == 'logger':
+        globals()['logger'] = setup_logging()
+        return globals()['logger']
+    if name == 'POSITION_NAMES':
+        globals()['POSITION_NAMES'] = _build_position_names()
+        return globals()['POSITION_NAMES']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
-    # Тестирование конфигурации
-    print(f"Приложение: {APP_CONFIG['title']} v{APP_CONFIG['version']}")
-    print(f"Поддерживаемые форматы: {IMAGE_CONFIG['supported_formats']['input']}")
-    print(f"Цвета: {list(COLORS.keys())}")
-    print(f"Шрифты: {list(FONTS.keys())}")
-    print(f"Пути: {list(FILE_PATHS.keys())}")
-    
-    logger.info("Конфигурация загружена успешно")
\ No newline at end of file
+    # Самопроверка вынесена в config_selftest.py, чтобы не раздувать
+    # байткод модуля для обычных импортеров
+    from config_selftest import run
+    run()
\ No newline at end of file
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+config_selftest.py - Самопроверка конфигурации LogoMaster Pro
+
+Вынесена из config.py, чтобы блок самопроверки не участвовал
+в компиляции модуля при обычном импорте конфигурации.
+"""
+
+from config import (
+    APP_CONFIG, COLORS, FONTS, FILE_PATHS, IMAGE_CONFIG, setup_logging
+)
+
+def run():
+    """Прогоняет самопроверку конфигурации"""
+    print(f"Приложение: {APP_CONFIG['title']} v{APP_CONFIG['version']}")
+    print(f"Поддерживаемые форматы: {IMAGE_CONFIG['supported_formats']['input']}")
+    print(f"Цвета: {list(COLORS.keys())}")
+    print(f"Шрифты: {list(FONTS.keys())}")
+    print(f"Пути: {list(FILE_PATHS.keys())}")
+
+    setup_logging().info("Конфигурация загружена успешно")
+
+if __name__ == '__main__':
+    run()
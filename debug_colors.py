@@ -4,12 +4,19 @@
 Отладочный скрипт для проверки цветов
 """
 
+import io
 import sys
 import os
 
 # Добавляем текущую директорию в путь
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Полная буферизация вывода: один-два flush вместо ~40 построчных
+sys.stdout = io.TextIOWrapper(
+    sys.stdout.buffer, encoding=sys.stdout.encoding,
+    errors='replace', line_buffering=False, write_through=False
+)
+
 try:
     from config import COLORS, logger
     print("✓ Успешный импорт config")
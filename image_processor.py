@@ -8,19 +8,101 @@ image_processor.py - Модуль обработки изображений дл
 
 import os
 import io
+import queue
+import shutil
+import threading
 import zipfile
-import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
-import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 import logging
 
 from config import (
-    IMAGE_CONFIG, LOGO_POSITIONS, NETWORK_CONFIG, 
-    get_config, is_supported_format, logger
+    IMAGE_CONFIG, LOGO_POSITIONS, NETWORK_CONFIG,
+    get_config, get_position_xy, is_supported_format, logger
 )
 
+# Процессор, живущий в рабочем процессе пула: создается один раз
+# на процесс через _init_worker, а не на каждое изображение
+_WORKER_PROCESSOR = None
+
+def _flatten_to_white(img: Image.Image) -> Image.Image:
+    """
+    Сводит изображение с прозрачностью на белый фон
+
+    Один numpy-проход (умножение + сдвиг) вместо создания белой
+    подложки и paste с маской — вдвое меньше трафика памяти.
+
+    Args:
+        img: Изображение в режиме RGBA/LA/P
+
+    Returns:
+        RGB-изображение на белом фоне
+    """
+    # Ленивая загрузка numpy: после первого вызова import — это поиск
+    # в sys.modules, а холодный старт не платит за инициализацию
+    import numpy as np
+
+    arr = np.asarray(img.convert('RGBA'))
+    rgb = arr[..., :3].astype(np.uint16)
+    alpha = arr[..., 3:4].astype(np.uint16)
+    # Точное деление на 255 через сдвиги: x/255 = (x + 128 + (x+128)>>8) >> 8
+    # для x < 65536; округление до ближайшего, непрозрачные пиксели
+    # проходят без изменений
+    x = rgb * alpha + (255 - alpha) * 255 + 128
+    out = ((x + (x >> 8)) >> 8).astype(np.uint8)
+    return Image.fromarray(out, 'RGB')
+
+@lru_cache(maxsize=32)
+def _opacity_lut(opacity: float) -> tuple:
+    """
+    256-элементная таблица для масштабирования альфа-канала
+
+    PIL применяет ее одним C-проходом через Image.point; таблица
+    мемоизируется по округленной прозрачности.
+    """
+    return tuple(int(v * opacity) for v in range(256))
+
+def _init_worker(logo_bytes: bytes):
+    """
+    Инициализатор рабочего процесса пула пакетной обработки
+
+    Args:
+        logo_bytes: Логотип, сериализованный в PNG
+    """
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = ImageProcessor()
+    _WORKER_PROCESSOR.current_logo = Image.open(io.BytesIO(logo_bytes)).copy()
+
+def _process_one(image_path: str, output_dir: str, logo_settings: dict) -> Optional[str]:
+    """
+    Обрабатывает одно изображение в рабочем процессе пула
+
+    Args:
+        image_path: Путь к исходному изображению
+        output_dir: Директория для сохранения
+        logo_settings: Настройки логотипа
+
+    Returns:
+        Путь к сохраненному файлу или None при ошибке
+    """
+    processor = _WORKER_PROCESSOR
+
+    image = processor.load_image(image_path)
+    if image is None:
+        return None
+
+    processed_image = processor.apply_logo(image, **logo_settings)
+    if processed_image is None:
+        return None
+
+    output_file = Path(output_dir) / f"{Path(image_path).stem}_with_logo.jpg"
+    if processor.save_image(processed_image, str(output_file), save_fast=True):
+        return str(output_file)
+    return None
+
 class ImageProcessor:
     """
     Класс для обработки изображений и применения логотипов
@@ -39,6 +121,10 @@ class ImageProcessor:
         self.logger = logger
         self.current_logo = None
         self.logo_cache = {}
+
+        # HTTP-сессия создается лениво при первой загрузке по URL —
+        # импорт requests (urllib3 и прочее) не задерживает холодный старт
+        self._session = None
         
         # Настройки по умолчанию
         self.default_settings = {
@@ -48,7 +134,15 @@ class ImageProcessor:
             'margin': IMAGE_CONFIG['logo_margin'],
         }
         
-        self.logger.info("ImageProcessor инициализирован")
+        # Версия в логе показывает, загружен ли SIMD-сборка Pillow
+        # (pillow-simd сообщает версию с суффиксом .postN); наличие
+        # libjpeg-turbo определяет скорость JPEG-декодирования
+        import PIL
+        from PIL import features
+        turbo = 'libjpeg-turbo' if features.check_feature('libjpeg_turbo') else 'libjpeg'
+        self.logger.info(
+            f"ImageProcessor инициализирован (Pillow {PIL.__version__}, {turbo})"
+        )
     
     def load_image(self, file_path: str) -> Optional[Image.Image]:
         """
@@ -76,34 +170,84 @@ class ImageProcessor:
                 return None
             
             # Загрузка изображения
-            with Image.open(file_path) as img:
-                # Конвертируем в RGB если необходимо
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Создаем белый фон для прозрачных изображений
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Проверка размеров
-                max_size = IMAGE_CONFIG['max_image_size']
-                if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                    self.logger.warning(f"Изображение слишком большое, изменяем размер: {img.size}")
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Создаем копию для возврата
-                result = img.copy()
-                
-            self.logger.info(f"Изображение загружено: {file_path} ({result.size})")
-            return result
+            max_size = IMAGE_CONFIG['max_image_size']
+            img = Image.open(file_path)
+
+            # draft() просит libjpeg декодировать сразу в масштабе
+            # 1/2..1/8 — большая часть IDCT для пикселей, которые
+            # все равно уйдут в thumbnail, не выполняется
+            if img.format == 'JPEG' and (
+                img.size[0] > max_size[0] * 2 or img.size[1] > max_size[1] * 2
+            ):
+                img.draft('RGB', max_size)
+
+            # load() декодирует изображение в память целиком — после этого
+            # img не зависит от файла, и копия для выхода из with не нужна
+            # (один пиксельный буфер вместо двух)
+            img.load()
+            if img.fp is not None:
+                img.fp.close()
+
+            # Конвертируем в RGB если необходимо
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Прозрачные изображения сводим на белый фон
+                img = _flatten_to_white(img)
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # Проверка размеров
+            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+                self.logger.warning(f"Изображение слишком большое, изменяем размер: {img.size}")
+                # Грубое уменьшение целочисленным box-фильтром: Lanczos
+                # затем свертывает изображение в k^2 раз меньшего размера
+                k = min(img.size[0] // max_size[0], img.size[1] // max_size[1])
+                if k >= 2:
+                    img = img.reduce(k)
+                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+            self.logger.info(f"Изображение загружено: {file_path} ({img.size})")
+            return img
             
         except Exception as e:
             self.logger.error(f"Ошибка загрузки изображения {file_path}: {e}")
             return None
     
+    def load_preview(self, file_path: str, max_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """
+        Быстро загружает уменьшенную версию изображения для показа
+
+        Для JPEG draft() декодирует сразу в масштабе 1/2..1/8 от
+        оригинала — полный IDCT ради экранного превью не выполняется.
+        Для применения логотипа и пакетной обработки используется
+        полный load_image.
+
+        Args:
+            file_path: Путь к файлу изображения
+            max_size: Целевой размер превью (ширина, высота)
+
+        Returns:
+            RGB-превью или None при ошибке
+        """
+        try:
+            img = Image.open(file_path)
+            if img.format == 'JPEG':
+                img.draft('RGB', max_size)
+            img.load()
+            if img.fp is not None:
+                img.fp.close()
+
+            if img.mode in ('RGBA', 'LA', 'P'):
+                img = _flatten_to_white(img)
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            return img
+
+        except Exception as e:
+            self.logger.error(f"Ошибка загрузки превью {file_path}: {e}")
+            return None
+
     def load_images_from_directory(self, directory_path: str) -> List[str]:
         """
         Загружает пути ко всем изображениям из директории
@@ -115,19 +259,29 @@ class ImageProcessor:
             Список путей к изображениям
         """
         image_paths = []
-        
+
         try:
-            directory = Path(directory_path)
-            if not directory.exists() or not directory.is_dir():
+            if not os.path.isdir(directory_path):
                 self.logger.error(f"Директория не найдена: {directory_path}")
                 return image_paths
-            
-            supported_extensions = IMAGE_CONFIG['supported_formats']['input']
-            
-            for file_path in directory.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                    image_paths.append(str(file_path))
-            
+
+            # Итеративный os.scandir вместо rglob: DirEntry дает имя и тип
+            # без аллокации Path на каждый файл
+            suffixes = tuple(IMAGE_CONFIG['supported_formats']['input'])
+            stack = [str(directory_path)]
+            while stack:
+                # Недоступный подкаталог не должен обрывать весь обход
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.name.lower().endswith(suffixes):
+                                image_paths.append(entry.path)
+                except OSError as e:
+                    self.logger.warning(f"Пропущена недоступная директория: {e}")
+                    continue
+
             image_paths.sort()  # Сортируем по алфавиту
             self.logger.info(f"Найдено {len(image_paths)} изображений в {directory_path}")
             
@@ -156,17 +310,44 @@ class ImageProcessor:
             extract_path = Path(extract_to)
             extract_path.mkdir(parents=True, exist_ok=True)
             
-            supported_extensions = IMAGE_CONFIG['supported_formats']['input']
-            
+            suffixes = tuple(IMAGE_CONFIG['supported_formats']['input'])
+
+            # Сначала фильтруем записи по центральному каталогу
             with zipfile.ZipFile(archive_path, 'r') as zip_file:
-                for file_info in zip_file.filelist:
-                    if not file_info.is_dir():
-                        file_extension = Path(file_info.filename).suffix.lower()
-                        if file_extension in supported_extensions:
-                            # Извлекаем файл
-                            extracted_path = zip_file.extract(file_info, extract_path)
-                            image_paths.append(extracted_path)
-            
+                image_infos = [
+                    file_info for file_info in zip_file.filelist
+                    if not file_info.is_dir()
+                    and file_info.filename.lower().endswith(suffixes)
+                ]
+
+            # zlib отпускает GIL, поэтому deflate распараллеливается;
+            # чтение через один ZipFile сериализуется внутренним локом,
+            # так что каждый поток открывает собственный дескриптор
+            thread_state = threading.local()
+            opened_files = []
+
+            def _extract(file_info):
+                zf = getattr(thread_state, 'zip_file', None)
+                if zf is None:
+                    zf = zipfile.ZipFile(archive_path, 'r')
+                    thread_state.zip_file = zf
+                    opened_files.append(zf)
+                try:
+                    return zf.extract(file_info, extract_path)
+                except FileExistsError:
+                    # ZipFile._extract_member создает каталоги неатомарно
+                    # (exists + makedirs): сосед по пулу мог успеть создать
+                    # тот же подкаталог между проверкой и mkdir — каталог
+                    # уже есть, повтор проходит
+                    return zf.extract(file_info, extract_path)
+
+            try:
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                    image_paths.extend(executor.map(_extract, image_infos))
+            finally:
+                for zf in opened_files:
+                    zf.close()
+
             self.logger.info(f"Извлечено {len(image_paths)} изображений из {archive_path}")
             
         except Exception as e:
@@ -187,10 +368,10 @@ class ImageProcessor:
         """
         try:
             headers = {'User-Agent': NETWORK_CONFIG['user_agent']}
-            
-            response = requests.get(
-                url, 
-                headers=headers, 
+
+            response = self._get_session().get(
+                url,
+                headers=headers,
                 timeout=NETWORK_CONFIG['timeout'],
                 stream=True
             )
@@ -210,10 +391,11 @@ class ImageProcessor:
                 filename = Path(url).name or 'downloaded_image.jpg'
                 save_path = temp_dir / filename
             
-            # Сохраняем файл
+            # Сохраняем файл: copyfileobj копирует в C-цикле с крупным
+            # буфером вместо Python-итерации по 8 КБ чанкам
+            response.raw.decode_content = True
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             self.logger.info(f"Изображение загружено: {url} -> {save_path}")
             return str(save_path)
@@ -244,14 +426,18 @@ class ImageProcessor:
             # Загружаем логотип
             with Image.open(logo_path) as logo:
                 # Сохраняем прозрачность для PNG
+                # convert() всегда возвращает новое изображение,
+                # отдельная копия для выхода из with не нужна
                 if logo.mode in ('RGBA', 'LA'):
                     self.current_logo = logo.convert('RGBA')
                 else:
                     self.current_logo = logo.convert('RGB')
-                
-                # Создаем копию
-                self.current_logo = self.current_logo.copy()
-            
+
+            # Свежий словарь вместо clear(): параллельный apply_logo,
+            # держащий снимок старого кэша, продолжает видеть
+            # согласованные записи прежнего логотипа
+            self.logo_cache = {}
+
             self.logger.info(f"Логотип загружен: {logo_path} ({self.current_logo.size})")
             return True
             
@@ -275,7 +461,13 @@ class ImageProcessor:
         Returns:
             Изображение с логотипом или None при ошибке
         """
-        if self.current_logo is None:
+        # Снимок разделяемого состояния: параллельные вызовы (превью,
+        # рабочий поток применения, конвейер) читают согласованную пару
+        # логотип+кэш, даже если load_logo подменит их посреди работы
+        logo = self.current_logo
+        logo_cache = self.logo_cache
+
+        if logo is None:
             self.logger.error("Логотип не загружен")
             return None
         
@@ -296,33 +488,52 @@ class ImageProcessor:
             # Вычисляем размер логотипа
             img_width, img_height = result.size
             logo_width = int(img_width * logo_size)
-            logo_height = int(self.current_logo.size[1] * (logo_width / self.current_logo.size[0]))
-            
-            # Изменяем размер логотипа
-            resized_logo = self.current_logo.resize(
-                (logo_width, logo_height), 
-                Image.Resampling.LANCZOS
+            logo_height = int(logo.size[1] * (logo_width / logo.size[0]))
+            
+            # Полностью подготовленный (масштаб + прозрачность) логотип
+            # кэшируется: в пакетной обработке и размер, и прозрачность
+            # одинаковы от изображения к изображению
+            prepared_key = (
+                logo.size,
+                (logo_width, logo_height),
+                round(opacity, 3),
             )
-            
-            # Применяем прозрачность
-            if opacity < 1.0:
-                if resized_logo.mode != 'RGBA':
+            resized_logo = logo_cache.get(prepared_key)
+            if resized_logo is None:
+                # Базовый ресайз кэшируется отдельно, чтобы смена одной
+                # прозрачности не перезапускала Lanczos
+                base_key = (logo.size, (logo_width, logo_height))
+                base_logo = logo_cache.get(base_key)
+                if base_logo is None:
+                    base_logo = logo.resize(
+                        (logo_width, logo_height),
+                        Image.Resampling.LANCZOS
+                    )
+                    logo_cache[base_key] = base_logo
+
+                resized_logo = base_logo
+
+                # Применяем прозрачность
+                if opacity < 1.0:
+                    # Копия обязательна: putalpha мутирует изображение,
+                    # а базовый ресайз лежит в кэше
                     resized_logo = resized_logo.convert('RGBA')
-                
-                # Создаем маску прозрачности
-                alpha = resized_logo.split()[-1]
-                alpha = ImageEnhance.Brightness(alpha).enhance(opacity)
-                resized_logo.putalpha(alpha)
+
+                    # point с готовой таблицей дешевле, чем создание
+                    # объекта ImageEnhance.Brightness на каждый вызов;
+                    # getchannel извлекает одну плоскость вместо четырех
+                    alpha = resized_logo.getchannel('A')
+                    alpha = alpha.point(_opacity_lut(round(opacity, 3)))
+                    resized_logo.putalpha(alpha)
+
+                logo_cache[prepared_key] = resized_logo
             
             # Вычисляем позицию
             if custom_position:
                 x, y = custom_position
             else:
-                if position in LOGO_POSITIONS:
-                    rel_x, rel_y = LOGO_POSITIONS[position]
-                else:
-                    rel_x, rel_y = LOGO_POSITIONS['bottom_right']
-                
+                rel_x, rel_y = get_position_xy(position)
+
                 # Вычисляем абсолютные координаты
                 x = int((img_width - logo_width) * rel_x)
                 y = int((img_height - logo_height) * rel_y)
@@ -344,7 +555,14 @@ class ImageProcessor:
             
             # Накладываем логотип
             if resized_logo.mode == 'RGBA':
-                result.paste(resized_logo, (x, y), resized_logo)
+                # alpha_composite идет по premultiplied-быстрому пути
+                # Pillow; компонуем только прямоугольник логотипа, чтобы
+                # не переводить все изображение в RGBA
+                box = (x, y, x + logo_width, y + logo_height)
+                region = Image.alpha_composite(
+                    result.crop(box).convert('RGBA'), resized_logo
+                )
+                result.paste(region.convert(result.mode), (x, y))
             else:
                 result.paste(resized_logo, (x, y))
             
@@ -370,9 +588,14 @@ class ImageProcessor:
             max_size = IMAGE_CONFIG['preview_size']
         
         try:
-            # Создаем копию
-            preview = image.copy()
-            
+            # Грубое уменьшение box-фильтром вместо копии: reduce сам
+            # возвращает новое изображение, а Lanczos достается меньший вход
+            k = min(image.size[0] // max_size[0], image.size[1] // max_size[1])
+            if k >= 2:
+                preview = image.reduce(k)
+            else:
+                preview = image.copy()
+
             # Изменяем размер с сохранением пропорций
             preview.thumbnail(max_size, Image.Resampling.LANCZOS)
             
@@ -382,15 +605,18 @@ class ImageProcessor:
             self.logger.error(f"Ошибка создания превью: {e}")
             return image
     
-    def save_image(self, image: Image.Image, file_path: str, quality: int = None) -> bool:
+    def save_image(self, image: Image.Image, file_path: str, quality: int = None,
+                   save_fast: bool = False) -> bool:
         """
         Сохраняет изображение в файл
-        
+
         Args:
             image: Изображение для сохранения
             file_path: Путь для сохранения
             quality: Качество JPEG (опционально)
-            
+            save_fast: Быстрое кодирование для пакетных путей — без
+                optimize-прохода и с стандартной субдискретизацией
+
         Returns:
             True если сохранение успешно
         """
@@ -404,22 +630,29 @@ class ImageProcessor:
             
             # Определяем параметры сохранения
             save_kwargs = {}
-            file_extension = Path(file_path).suffix.lower()
+            # Срез вместо Path().suffix — без аллокации PurePath
+            dot = file_path.rfind('.')
+            file_extension = file_path[dot:].lower() if dot >= 0 else ''
             
             if file_extension in ['.jpg', '.jpeg']:
                 # Конвертируем в RGB для JPEG
                 if image.mode != 'RGB':
-                    if image.mode == 'RGBA':
-                        # Создаем белый фон
-                        background = Image.new('RGB', image.size, (255, 255, 255))
-                        background.paste(image, mask=image.split()[-1])
-                        image = background
+                    if image.mode in ('RGBA', 'LA', 'P'):
+                        # Прозрачные изображения сводим на белый фон
+                        image = _flatten_to_white(image)
                     else:
                         image = image.convert('RGB')
                 
                 save_kwargs['quality'] = quality or IMAGE_CONFIG['jpeg_quality']
-                save_kwargs['optimize'] = True
-                
+                if save_fast:
+                    # optimize-проход Хаффмана почти не уменьшает файл,
+                    # но заметно удорожает кодирование каждого кадра
+                    save_kwargs['optimize'] = False
+                    save_kwargs['progressive'] = False
+                    save_kwargs['subsampling'] = 2
+                else:
+                    save_kwargs['optimize'] = True
+
             elif file_extension == '.png':
                 save_kwargs['compress_level'] = IMAGE_CONFIG['png_compression']
                 save_kwargs['optimize'] = True
@@ -434,63 +667,185 @@ class ImageProcessor:
             self.logger.error(f"Ошибка сохранения изображения {file_path}: {e}")
             return False
     
-    def batch_process(self, image_paths: List[str], output_dir: str, 
-                     progress_callback=None, **logo_settings) -> List[str]:
+    def batch_process(self, image_paths: List[str], output_dir: str,
+                     progress_callback=None, max_workers: int = None,
+                     cancel_check=None, **logo_settings) -> List[str]:
         """
         Пакетная обработка изображений
-        
+
+        Изображения независимы друг от друга, поэтому decode/resize/encode
+        раскладываются по ядрам через ProcessPoolExecutor.
+
         Args:
             image_paths: Список путей к изображениям
             output_dir: Директория для сохранения
             progress_callback: Функция обратного вызова для прогресса
+            max_workers: Количество рабочих процессов (по умолчанию
+                cpu_count - 1, чтобы ограничить пиковое потребление памяти)
+            cancel_check: Функция, возвращающая True для прерывания
             **logo_settings: Настройки логотипа
-            
+
         Returns:
             Список путей к обработанным изображениям
         """
         if self.current_logo is None:
             self.logger.error("Логотип не загружен для пакетной обработки")
             return []
-        
+
         processed_paths = []
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
-        
+
         total_images = len(image_paths)
-        
-        for i, image_path in enumerate(image_paths):
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+
+        # На одном рабочем процессе пул вырождается в последовательный
+        # проход — конвейер с I/O-потоками перекрывает чтение и кодирование
+        # с наложением логотипа без затрат на второй процесс
+        if max_workers == 1:
+            return self._batch_process_pipeline(
+                image_paths, output_path, progress_callback,
+                cancel_check, logo_settings
+            )
+
+        # Сериализуем логотип один раз — PNG-байты picklable и дешево
+        # передаются каждому процессу через инициализатор пула
+        logo_buffer = io.BytesIO()
+        self.current_logo.save(logo_buffer, 'PNG')
+        logo_bytes = logo_buffer.getvalue()
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(logo_bytes,)
+            ) as executor:
+                futures = {
+                    executor.submit(_process_one, image_path, str(output_path), logo_settings): image_path
+                    for image_path in image_paths
+                }
+
+                for i, future in enumerate(as_completed(futures)):
+                    # Отмена снимает еще не начатые задания; уже идущие
+                    # доделываются, но новые процессы работу не получают.
+                    # cancel() вручную вместо cancel_futures=True — тот
+                    # kwarg появился только в 3.9, а мы поддерживаем 3.8
+                    if cancel_check and cancel_check():
+                        for pending in futures:
+                            pending.cancel()
+                        executor.shutdown(wait=False)
+                        self.logger.info("Пакетная обработка прервана пользователем")
+                        break
+
+                    image_path = futures[future]
+                    if progress_callback:
+                        progress_callback(i, total_images, f"Обработка {Path(image_path).name}")
+
+                    try:
+                        result = future.result()
+                        if result:
+                            processed_paths.append(result)
+                    except Exception as e:
+                        self.logger.error(f"Ошибка обработки {image_path}: {e}")
+
+        except Exception as e:
+            self.logger.error(f"Ошибка пула пакетной обработки: {e}")
+
+        if progress_callback:
+            progress_callback(total_images, total_images, "Обработка завершена")
+
+        self.logger.info(f"Пакетная обработка завершена: {len(processed_paths)}/{total_images}")
+        return processed_paths
+
+    def _batch_process_pipeline(self, image_paths: List[str], output_path: Path,
+                                progress_callback, cancel_check,
+                                logo_settings: dict) -> List[str]:
+        """
+        Однопроцессный конвейер load → apply_logo → save
+
+        Декодирование и кодирование выполняются в потоках (libjpeg/libpng
+        отпускают GIL), наложение логотипа — в основном потоке. Ограниченные
+        очереди держат в памяти не больше нескольких изображений.
+
+        Args:
+            image_paths: Список путей к изображениям
+            output_path: Директория для сохранения
+            progress_callback: Функция обратного вызова для прогресса
+            logo_settings: Настройки логотипа
+
+        Returns:
+            Список путей к обработанным изображениям
+        """
+        load_queue = queue.Queue(maxsize=4)
+        save_queue = queue.Queue(maxsize=4)
+        processed_paths = []
+        total_images = len(image_paths)
+        cancelled = False
+
+        def _loader():
+            for image_path in image_paths:
+                if cancelled:
+                    break
+                load_queue.put((image_path, self.load_image(image_path)))
+            load_queue.put(None)
+
+        def _saver():
+            while True:
+                item = save_queue.get()
+                if item is None:
+                    break
+                file_path, image = item
+                if self.save_image(image, file_path, save_fast=True):
+                    processed_paths.append(file_path)
+
+        loader = threading.Thread(target=_loader, daemon=True)
+        saver = threading.Thread(target=_saver, daemon=True)
+        loader.start()
+        saver.start()
+
+        processed = 0
+        while True:
+            item = load_queue.get()
+            if item is None:
+                break
+
+            if cancel_check and cancel_check():
+                cancelled = True
+                self.logger.info("Пакетная обработка прервана пользователем")
+                break
+
+            image_path, image = item
+            if progress_callback:
+                progress_callback(processed, total_images,
+                                  f"Обработка {Path(image_path).name}")
+            processed += 1
+
+            if image is None:
+                continue
+
             try:
-                # Обновляем прогресс
-                if progress_callback:
-                    progress_callback(i, total_images, f"Обработка {Path(image_path).name}")
-                
-                # Загружаем изображение
-                image = self.load_image(image_path)
-                if image is None:
-                    continue
-                
-                # Применяем логотип
-                processed_image = self.apply_logo(image, **logo_settings)
-                if processed_image is None:
-                    continue
-                
-                # Сохраняем результат
-                original_name = Path(image_path).stem
-                output_file = output_path / f"{original_name}_with_logo.jpg"
-                
-                if self.save_image(processed_image, str(output_file)):
-                    processed_paths.append(str(output_file))
-                
+                result = self.apply_logo(image, **logo_settings)
+                if result is not None:
+                    output_file = output_path / f"{Path(image_path).stem}_with_logo.jpg"
+                    save_queue.put((str(output_file), result))
             except Exception as e:
                 self.logger.error(f"Ошибка обработки {image_path}: {e}")
-                continue
-        
+
+        save_queue.put(None)
+        if cancelled:
+            # Опустошаем очередь, чтобы загрузчик не завис на put
+            while load_queue.get() is not None:
+                pass
+        loader.join()
+        saver.join()
+
         if progress_callback:
             progress_callback(total_images, total_images, "Обработка завершена")
-        
+
         self.logger.info(f"Пакетная обработка завершена: {len(processed_paths)}/{total_images}")
         return processed_paths
-    
+
     def get_image_info(self, image_path: str) -> dict:
         """
         Получает информацию об изображении
@@ -526,6 +881,34 @@ class ImageProcessor:
         
         return info
     
+    def _get_session(self):
+        """
+        Возвращает HTTP-сессию с пулом соединений, создавая при необходимости
+
+        Одна сессия на процессор: keep-alive переиспользует TCP/TLS-
+        соединения между загрузками с одного хоста.
+        """
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=16, pool_maxsize=32,
+                max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3)
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+
+        return self._session
+
+    def close(self):
+        """
+        Закрывает HTTP-сессию и освобождает пул соединений
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def cleanup_temp_files(self):
         """
         Очищает временные файлы
@@ -13,8 +13,12 @@ main.py - Главный модуль приложения LogoMaster Pro
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import io
 import os
 import sys
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from PIL import Image, ImageTk
@@ -23,7 +27,7 @@ from PIL import Image, ImageTk
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import (
-    APP_CONFIG, COLORS, FONTS, SIZES, UI_CONFIG, MESSAGES,
+    APP_CONFIG, COLORS, FONTS, SIZES, UI_CONFIG, MESSAGES, IMAGE_CONFIG,
     get_config, logger, setup_logging
 )
 from image_processor import ImageProcessor
@@ -32,16 +36,68 @@ from ui_components import (
     SettingsPanel, StatusBar
 )
 from utils import (
-    ensure_directory, validate_image_file, create_backup,
-    create_zip_archive, get_unique_filename, format_file_size,
-    PerformanceTimer, cleanup_temp_directory
+    validate_image_file, create_backup, get_unique_filename,
+    format_file_size, PerformanceTimer, cleanup_temp_directory
 )
 
+# Путь к иконке разрешается один раз при импорте, а не на каждый запуск окна
+_ICON_PATH = get_config('paths')['assets_dir'] / 'icon.ico'
+if not _ICON_PATH.exists():
+    _ICON_PATH = None
+
+def _parse_dnd_files(data: str) -> List[str]:
+    """
+    Разбирает список путей из события Tk drag & drop
+
+    Tk группирует пути с пробелами фигурными скобками:
+    '{C:/path with spaces/a.jpg} /simple/b.png'. Наивный split()
+    рассекает такие пути и порождает заведомо провальные проверки
+    несуществующих файлов.
+
+    Args:
+        data: Строка event.data от Tk
+
+    Returns:
+        Список путей
+    """
+    paths = []
+    current = []
+    in_braces = False
+
+    for char in data:
+        if in_braces:
+            if char == '}':
+                in_braces = False
+                paths.append(''.join(current))
+                current = []
+            else:
+                current.append(char)
+        elif char == '{':
+            in_braces = True
+        elif char.isspace():
+            if current:
+                paths.append(''.join(current))
+                current = []
+        else:
+            current.append(char)
+
+    if current:
+        paths.append(''.join(current))
+
+    return paths
+
 class LogoMasterApp:
     """
     Главный класс приложения LogoMaster Pro
     """
-    
+
+    # Максимум обработанных изображений, удерживаемых в памяти
+    PROCESSED_CACHE_LIMIT = 32
+
+    # Максимум превью показа, удерживаемых в памяти
+    DISPLAY_CACHE_LIMIT = 8
+
+
     def __init__(self):
         """
         Инициализация приложения
@@ -53,10 +109,40 @@ class LogoMasterApp:
         # Инициализация компонентов
         self.image_processor = ImageProcessor()
         self.current_images = []  # Список загруженных изображений
+        self._current_basenames = []  # Базовые имена (параллельно current_images)
+        self._has_current_image = False  # В просмотрщике есть изображение
         self.current_image_index = 0
-        self.processed_images = {}  # Кэш обработанных изображений
+        self.processed_images = OrderedDict()  # LRU-кэш обработанных изображений
         self.logo_loaded = False
         self.is_processing = False
+
+        # Префетч соседних изображений: декодирование прячется за паузой
+        # между нажатиями кнопок навигации
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_futures = {}  # путь -> Future с декодированным изображением
+
+        # Отложенное применение настроек (дебаунс ползунков)
+        self._apply_pending_id = None
+
+        # Отложенное обновление панели информации (дебаунс навигации)
+        self._pending_info_job = None
+
+        # Последние выставленные состояния кнопок (диф вместо
+        # безусловной перенастройки всех виджетов)
+        self._prev_btn_states = {}
+
+        # Уменьшенные копии оригиналов для живого предпросмотра
+        self._preview_sources = OrderedDict()
+
+        # Превью в размер окна для показа и префетча соседей
+        self._display_cache = OrderedDict()
+        self._display_cache_lock = threading.Lock()
+
+        # Последний показанный текст информационной панели
+        self._last_info_str = None
+
+        # Кэш метаданных изображений (ключ учитывает mtime и размер)
+        self._info_cache = OrderedDict()
         
         # Создание главного окна
         self.root = tk.Tk()
@@ -79,12 +165,11 @@ class LogoMasterApp:
         self.root.configure(bg=COLORS['background'])
         
         # Иконка приложения (если есть)
-        try:
-            icon_path = get_config('paths')['assets_dir'] / 'icon.ico'
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
-        except Exception as e:
-            logger.debug(f"Не удалось загрузить иконку: {e}")
+        if _ICON_PATH is not None:
+            try:
+                self.root.iconbitmap(str(_ICON_PATH))
+            except Exception as e:
+                logger.debug(f"Не удалось загрузить иконку: {e}")
         
         # Обработчик закрытия
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -394,19 +479,28 @@ class LogoMasterApp:
         Обработчик события drop
         """
         try:
-            files = event.data.split()
+            files = _parse_dnd_files(event.data)
             image_files = []
-            
+            file_candidates = []
+
             for file_path in files:
-                file_path = file_path.strip('{}"')  # Очистка от лишних символов
+                file_path = file_path.strip('"')
                 if os.path.isfile(file_path):
-                    is_valid, _ = validate_image_file(file_path)
-                    if is_valid:
-                        image_files.append(file_path)
+                    file_candidates.append(file_path)
                 elif os.path.isdir(file_path):
                     # Сканируем директорию
                     dir_images = self.image_processor.load_images_from_directory(file_path)
                     image_files.extend(dir_images)
+
+            # Валидация — stat плюс разбор заголовка; обе операции
+            # отпускают GIL и параллелятся по потокам
+            if file_candidates:
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    results = list(executor.map(validate_image_file, file_candidates))
+                image_files.extend(
+                    path for path, (is_valid, _, _) in zip(file_candidates, results)
+                    if is_valid
+                )
             
             if image_files:
                 self._load_image_files(image_files)
@@ -458,12 +552,19 @@ class LogoMasterApp:
         """
         try:
             valid_files = []
-            
-            # Валидируем файлы
-            for file_path in file_paths:
-                is_valid, error_msg = validate_image_file(file_path)
+
+            # Валидируем файлы параллельно: на больших выборках
+            # последовательный стат + разбор заголовков замораживал UI
+            total_size = 0
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(validate_image_file, file_paths))
+
+            # Размер файла приходит из того же stat, что и валидация —
+            # отдельный проход по getsize не нужен
+            for file_path, (is_valid, error_msg, file_size) in zip(file_paths, results):
                 if is_valid:
                     valid_files.append(file_path)
+                    total_size += file_size
                 else:
                     logger.warning(f"Пропуск файла {file_path}: {error_msg}")
             
@@ -476,6 +577,9 @@ class LogoMasterApp:
             
             # Загружаем изображения
             self.current_images = valid_files
+            # Базовые имена считаем один раз при загрузке списка, а не
+            # при каждом обновлении панели информации
+            self._current_basenames = [os.path.basename(p) for p in valid_files]
             self.current_image_index = 0
             self.processed_images.clear()
             
@@ -490,7 +594,7 @@ class LogoMasterApp:
             
             self.status_bar.set_status(
                 f"Загружено {len(valid_files)} изображений",
-                f"Размер: {sum(os.path.getsize(f) for f in valid_files) / (1024*1024):.1f} МБ"
+                f"Размер: {total_size / (1024*1024):.1f} МБ"
             )
             
             logger.info(f"Загружено {len(valid_files)} изображений")
@@ -519,7 +623,7 @@ class LogoMasterApp:
             
             if file_path:
                 # Валидируем логотип
-                is_valid, error_msg = validate_image_file(file_path)
+                is_valid, error_msg, logo_size = validate_image_file(file_path)
                 if not is_valid:
                     messagebox.showerror("Ошибка", f"Неподходящий файл логотипа: {error_msg}")
                     return
@@ -533,7 +637,7 @@ class LogoMasterApp:
                     logo_name = os.path.basename(file_path)
                     self.status_bar.set_status(
                         f"Логотип загружен: {logo_name}",
-                        f"Размер: {format_file_size(os.path.getsize(file_path))}"
+                        f"Размер: {format_file_size(logo_size)}"
                     )
                     
                     logger.info(f"Логотип загружен: {file_path}")
@@ -553,46 +657,93 @@ class LogoMasterApp:
         
         try:
             current_file = self.current_images[self.current_image_index]
-            
-            # Загружаем изображение если не в кэше
-            if current_file not in self.processed_images:
-                image = self.image_processor.load_image(current_file)
-                if image is None:
-                    messagebox.showerror("Ошибка", "Не удалось загрузить изображение")
-                    return
-            else:
-                image = self.processed_images[current_file]['original']
-            
-            # Получаем настройки
+
+            # Повторное применение с теми же настройками — no-op:
+            # показываем готовый результат из кэша
             settings = self.settings_panel.get_settings()
-            
-            # Применяем логотип
-            with PerformanceTimer("Применение логотипа") as timer:
-                processed_image = self.image_processor.apply_logo(image, **settings)
-            
+            cached = self.processed_images.get(current_file)
+            if cached and cached['settings'] == settings:
+                self._display_processed_image(
+                    cached['processed'], cache_key=(current_file, 'processed')
+                )
+                return
+
+            # Оригинал всегда декодируется заново (обычно он уже лежит
+            # в префетч-кэше) — держать его в processed_images слишком
+            # дорого по памяти на больших партиях
+            image = self._load_image_cached(current_file)
+            if image is None:
+                messagebox.showerror("Ошибка", "Не удалось загрузить изображение")
+                return
+
+            # Наложение уходит в рабочий поток (Pillow отпускает GIL),
+            # чтобы интерфейс не замирал на больших изображениях
+            self.apply_logo_btn.config(state='disabled')
+            self.status_bar.set_status("Применение логотипа...")
+
+            def _worker():
+                with PerformanceTimer("Применение логотипа") as timer:
+                    processed_image = self.image_processor.apply_logo(image, **settings)
+
+                # Результат возвращаем в Tk-поток через after
+                self.root.after(0, lambda: self._finish_apply(
+                    current_file, processed_image, settings, timer
+                ))
+
+            threading.Thread(target=_worker, daemon=True).start()
+
+        except Exception as e:
+            logger.error(f"Ошибка применения логотипа: {e}")
+            messagebox.showerror("Ошибка", f"Ошибка применения логотипа: {e}")
+
+    def _finish_apply(self, current_file: str,
+                      processed_image: Optional[Image.Image],
+                      settings: Dict[str, Any], timer: PerformanceTimer):
+        """
+        Завершение применения логотипа в Tk-потоке
+
+        Args:
+            current_file: Путь к обрабатываемому файлу
+            processed_image: Результат наложения или None при ошибке
+            settings: Использованные настройки
+            timer: Таймер операции
+        """
+        try:
             if processed_image:
-                # Сохраняем в кэш
+                # Сохраняем в кэш; оригинал не храним — он всегда
+                # восстановим декодированием с диска
                 self.processed_images[current_file] = {
-                    'original': image,
                     'processed': processed_image,
                     'settings': settings.copy()
                 }
-                
-                # Отображаем результат
-                self._display_processed_image(processed_image)
-                
+                self.processed_images.move_to_end(current_file)
+
+                # Явное вытеснение: без лимита партия в пару сотен
+                # 12-мегапиксельных результатов съедает гигабайты
+                while len(self.processed_images) > self.PROCESSED_CACHE_LIMIT:
+                    evicted, _ = self.processed_images.popitem(last=False)
+                    self.image_viewer.invalidate_cache((evicted, 'processed'))
+
+                # Отображаем результат; прежний PhotoImage для этого
+                # файла устарел вместе с настройками
+                self.image_viewer.invalidate_cache((current_file, 'processed'))
+                self._display_processed_image(
+                    processed_image, cache_key=(current_file, 'processed')
+                )
+
                 # Обновляем UI
                 self._update_ui_state()
-                
+
                 self.status_bar.set_status(
                     "Логотип применен к изображению",
                     f"Время: {timer.get_duration():.2f} сек"
                 )
-                
+
                 logger.info(f"Логотип применен к {current_file}")
             else:
+                self._update_ui_state()
                 messagebox.showerror("Ошибка", "Не удалось применить логотип")
-                
+
         except Exception as e:
             logger.error(f"Ошибка применения логотипа: {e}")
             messagebox.showerror("Ошибка", f"Ошибка применения логотипа: {e}")
@@ -638,6 +789,7 @@ class LogoMasterApp:
                             self.current_images,
                             output_dir,
                             progress_callback,
+                            cancel_check=progress_dialog.is_cancelled,
                             **settings
                         )
                     
@@ -781,23 +933,37 @@ class LogoMasterApp:
             if not output_dir:
                 return
             
-            saved_count = 0
-            
-            for file_path, data in self.processed_images.items():
+            # JPEG-кодирование в Pillow отпускает GIL, поэтому сохранение
+            # раскладывается по потокам. Выбор уникального имени защищен
+            # локом, а имя резервируется пустым файлом до кодирования,
+            # чтобы параллельные задачи не получили одно и то же имя
+            name_lock = threading.Lock()
+
+            def _save_one(item):
+                file_path, data = item
                 try:
-                    original_name = Path(file_path).stem
-                    save_name = get_unique_filename(
-                        output_dir,
-                        f"{original_name}_with_logo",
-                        ".jpg"
+                    # splitext+basename вместо Path().stem — без
+                    # аллокации PurePath на каждый файл партии
+                    original_name = os.path.splitext(os.path.basename(file_path))[0]
+                    with name_lock:
+                        save_name = get_unique_filename(
+                            output_dir,
+                            f"{original_name}_with_logo",
+                            ".jpg"
+                        )
+                        save_path = os.path.join(output_dir, save_name)
+                        open(save_path, 'a').close()
+
+                    return self.image_processor.save_image(
+                        data['processed'], save_path, save_fast=True
                     )
-                    save_path = os.path.join(output_dir, save_name)
-                    
-                    if self.image_processor.save_image(data['processed'], save_path):
-                        saved_count += 1
-                        
+
                 except Exception as e:
                     logger.error(f"Ошибка сохранения {file_path}: {e}")
+                    return False
+
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                saved_count = sum(executor.map(_save_one, self.processed_images.items()))
             
             if saved_count > 0:
                 messagebox.showinfo(
@@ -844,49 +1010,98 @@ class LogoMasterApp:
             
             if not zip_path:
                 return
-            
-            # Создаем временные файлы
-            temp_dir = get_config('paths')['temp_dir'] / 'zip_export'
-            ensure_directory(str(temp_dir))
-            
-            temp_files = []
-            
-            try:
-                for file_path, data in self.processed_images.items():
-                    original_name = Path(file_path).stem
-                    temp_name = f"{original_name}_with_logo.jpg"
-                    temp_path = temp_dir / temp_name
-                    
-                    if self.image_processor.save_image(data['processed'], str(temp_path)):
-                        temp_files.append(str(temp_path))
-                
-                # Создаем архив
-                if create_zip_archive(temp_files, zip_path):
-                    messagebox.showinfo(
-                        "Успех",
-                        f"Архив создан: {os.path.basename(zip_path)}\n"
-                        f"Изображений: {len(temp_files)}"
-                    )
-                    
-                    self.status_bar.set_status(
-                        f"Архив создан: {os.path.basename(zip_path)}",
-                        f"Размер: {format_file_size(os.path.getsize(zip_path))}"
-                    )
-                else:
-                    messagebox.showerror("Ошибка", "Не удалось создать архив")
-                    
-            finally:
-                # Очищаем временные файлы
-                for temp_file in temp_files:
-                    try:
-                        os.remove(temp_file)
-                    except:
-                        pass
-                        
+
+            # Кодирование и запись архива уходят в рабочий поток — на
+            # большой партии они замораживали интерфейс целиком
+            items = list(self.processed_images.items())
+
+            self.is_processing = True
+            self._update_ui_state()
+            self.status_bar.set_status("Создание архива...")
+
+            threading.Thread(
+                target=self._create_archive_worker,
+                args=(zip_path, items),
+                daemon=True
+            ).start()
+
         except Exception as e:
             logger.error(f"Ошибка создания архива: {e}")
             messagebox.showerror("Ошибка", f"Ошибка создания архива: {e}")
-    
+
+    def _create_archive_worker(self, zip_path: str, items: list):
+        """
+        Кодирование изображений и запись ZIP архива вне Tk-потока
+
+        Args:
+            zip_path: Путь к создаваемому архиву
+            items: Пары (путь исходного файла, данные кэша)
+        """
+        error = None
+        count = 0
+
+        try:
+            # Кодируем JPEG прямо в память: без временных файлов каждое
+            # изображение проходит один encode вместо encode + запись +
+            # чтение; Pillow отпускает GIL, поэтому кодируем параллельно
+            def _encode_one(item):
+                file_path, data = item
+                image = data['processed']
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+
+                buffer = io.BytesIO()
+                image.save(
+                    buffer, 'JPEG',
+                    quality=IMAGE_CONFIG['jpeg_quality'],
+                    optimize=False, progressive=False, subsampling=2
+                )
+                base = os.path.splitext(os.path.basename(file_path))[0]
+                return f"{base}_with_logo.jpg", buffer.getvalue()
+
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                encoded = list(executor.map(_encode_one, items))
+
+            # JPEG уже сжат — ZIP_STORED не тратит CPU на deflate
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zip_file:
+                for name, blob in encoded:
+                    zip_file.writestr(name, blob)
+
+            count = len(encoded)
+
+        except Exception as e:
+            error = e
+            logger.error(f"Ошибка создания архива: {e}")
+
+        self.root.after(0, lambda: self._finish_archive(zip_path, count, error))
+
+    def _finish_archive(self, zip_path: str, count: int, error: Optional[Exception]):
+        """
+        Завершение создания архива в Tk-потоке
+
+        Args:
+            zip_path: Путь к архиву
+            count: Количество записанных изображений
+            error: Ошибка рабочего потока или None
+        """
+        self.is_processing = False
+        self._update_ui_state()
+
+        if error is not None:
+            messagebox.showerror("Ошибка", f"Ошибка создания архива: {error}")
+            return
+
+        messagebox.showinfo(
+            "Успех",
+            f"Архив создан: {os.path.basename(zip_path)}\n"
+            f"Изображений: {count}"
+        )
+
+        self.status_bar.set_status(
+            f"Архив создан: {os.path.basename(zip_path)}",
+            f"Размер: {format_file_size(os.path.getsize(zip_path))}"
+        )
+
     def _display_current_image(self):
         """
         Отображение текущего изображения
@@ -900,90 +1115,239 @@ class LogoMasterApp:
             # Проверяем, есть ли обработанная версия
             if current_file in self.processed_images:
                 image = self.processed_images[current_file]['processed']
+                self.processed_images.move_to_end(current_file)
+                cache_key = (current_file, 'processed')
             else:
-                # Загружаем оригинальное изображение
-                image = self.image_processor.load_image(current_file)
+                # Для показа хватает превью-декода в размер окна: JPEG
+                # декодируется через draft в 1/2..1/8 масштаба; полный
+                # декод остается за применением логотипа
+                viewer_size = self._viewer_size()
+                image = self._get_display_preview(current_file, viewer_size)
                 if image is None:
+                    self._has_current_image = False
                     self.image_viewer.show_error("Не удалось загрузить изображение")
                     return
-            
+                cache_key = (current_file, 'original')
+
             # Отображаем изображение
-            self.image_viewer.display_image(image)
-            
+            self.image_viewer.display_image(image, cache_key=cache_key)
+            self._has_current_image = True
+
+            # Заранее декодируем соседей для мгновенной навигации
+            self._schedule_prefetch()
+
         except Exception as e:
+            self._has_current_image = False
             logger.error(f"Ошибка отображения изображения: {e}")
             self.image_viewer.show_error(f"Ошибка отображения: {e}")
+
+    def _load_image_cached(self, file_path: str) -> Optional[Image.Image]:
+        """
+        Возвращает изображение из префетч-кэша или декодирует с диска
+
+        Args:
+            file_path: Путь к файлу изображения
+
+        Returns:
+            PIL Image объект или None при ошибке
+        """
+        future = self._prefetch_futures.pop(file_path, None)
+        if future is not None:
+            try:
+                image = future.result()
+                if image is not None:
+                    return image
+            except Exception as e:
+                logger.debug(f"Префетч не удался для {file_path}: {e}")
+
+        return self.image_processor.load_image(file_path)
+
+    def _viewer_size(self) -> tuple:
+        """
+        Текущий целевой размер области просмотра
+        """
+        return (
+            max(self.image_viewer.canvas.winfo_width(), 800),
+            max(self.image_viewer.canvas.winfo_height(), 600),
+        )
+
+    def _get_display_preview(self, file_path: str, viewer_size: tuple) -> Optional[Image.Image]:
+        """
+        Превью для показа из кэша или с диска
+
+        Кэш наполняется и префетчем соседей, поэтому листание в обе
+        стороны обычно попадает в уже декодированное превью.
+
+        Args:
+            file_path: Путь к изображению
+            viewer_size: Целевой размер области просмотра
+
+        Returns:
+            PIL Image объект или None при ошибке
+        """
+        key = (file_path, viewer_size)
+        with self._display_cache_lock:
+            image = self._display_cache.get(key)
+            if image is not None:
+                self._display_cache.move_to_end(key)
+                return image
+
+        image = self.image_processor.load_preview(file_path, viewer_size)
+        if image is not None:
+            self._store_display_preview(key, image)
+        return image
+
+    def _store_display_preview(self, key: tuple, image: Image.Image):
+        """
+        Кладет превью в ограниченный LRU-кэш показа
+        """
+        with self._display_cache_lock:
+            self._display_cache[key] = image
+            self._display_cache.move_to_end(key)
+            while len(self._display_cache) > self.DISPLAY_CACHE_LIMIT:
+                self._display_cache.popitem(last=False)
+
+    def _prefetch_preview(self, file_path: str, viewer_size: tuple):
+        """
+        Фоновое декодирование превью соседнего изображения
+        """
+        key = (file_path, viewer_size)
+        with self._display_cache_lock:
+            if key in self._display_cache:
+                return
+        image = self.image_processor.load_preview(file_path, viewer_size)
+        if image is not None:
+            self._store_display_preview(key, image)
+
+    def _schedule_prefetch(self):
+        """
+        Ставит в очередь декодирование соседних изображений
+        """
+        # Текущий файл включается тоже: его полный декод нужен
+        # применению логотипа, пока на экране показывается превью
+        neighbours = set()
+        for idx in (self.current_image_index - 1, self.current_image_index,
+                    self.current_image_index + 1):
+            if 0 <= idx < len(self.current_images):
+                neighbours.add(self.current_images[idx])
+
+        # Футуры вне окна навигации отменяем, чтобы не копить буферы
+        for path in list(self._prefetch_futures):
+            if path not in neighbours:
+                self._prefetch_futures.pop(path).cancel()
+
+        for path in neighbours:
+            if path not in self._prefetch_futures and path not in self.processed_images:
+                self._prefetch_futures[path] = self._prefetch_pool.submit(
+                    self.image_processor.load_image, path
+                )
+
+        # Превью соседей греем отдельно: показ идет через draft-декод
+        # в размер окна, а не через полный декод выше
+        viewer_size = self._viewer_size()
+        current_file = self.current_images[self.current_image_index]
+        for path in neighbours:
+            if path != current_file and path not in self.processed_images:
+                self._prefetch_pool.submit(self._prefetch_preview, path, viewer_size)
     
-    def _display_processed_image(self, image: Image.Image):
+    def _display_processed_image(self, image: Image.Image, cache_key=None):
         """
         Отображение обработанного изображения
-        
+
         Args:
             image: Обработанное изображение
+            cache_key: Ключ для кэша PhotoImage (опционально)
         """
         try:
-            self.image_viewer.display_image(image)
+            self.image_viewer.display_image(image, cache_key=cache_key)
         except Exception as e:
             logger.error(f"Ошибка отображения обработанного изображения: {e}")
     
+    def _goto(self, delta: int):
+        """
+        Переход на delta изображений от текущего
+
+        Args:
+            delta: Смещение индекса (-1 — назад, +1 — вперед)
+        """
+        if not self.current_images:
+            return
+        new_index = self.current_image_index + delta
+        if 0 <= new_index < len(self.current_images):
+            self.current_image_index = new_index
+            self._display_current_image()
+            self._schedule_info_update()
+
     def _prev_image(self):
         """
         Переход к предыдущему изображению
         """
-        if self.current_images and self.current_image_index > 0:
-            self.current_image_index -= 1
-            self._display_current_image()
-            self._update_image_info()
-            self._update_navigation_state()
-    
+        self._goto(-1)
+
     def _next_image(self):
         """
         Переход к следующему изображению
         """
-        if self.current_images and self.current_image_index < len(self.current_images) - 1:
-            self.current_image_index += 1
-            self._display_current_image()
-            self._update_image_info()
-            self._update_navigation_state()
-    
+        self._goto(1)
+
+    def _schedule_info_update(self):
+        """
+        Отложенное обновление панели информации и навигации
+
+        При зажатой стрелке autorepeat вызывает навигацию десятки раз в
+        секунду; обновляем панель только для последнего перехода в
+        30-мс окне, остальные вызовы коалесцируются.
+        """
+        if self._pending_info_job is not None:
+            self.root.after_cancel(self._pending_info_job)
+        self._pending_info_job = self.root.after(30, self._do_info_update)
+
+    def _do_info_update(self):
+        """
+        Фактическое обновление панели информации и навигации
+        """
+        self._pending_info_job = None
+        self._update_image_info()
+        self._update_navigation_state()
+
     def _zoom_in(self):
         """
         Увеличение масштаба
         """
-        # Эмулируем событие колеса мыши для увеличения
-        event = type('Event', (), {'delta': 120, 'num': 4})()
-        self.image_viewer._zoom(event)
-    
+        self.image_viewer.zoom_by(1.1)
+
     def _zoom_out(self):
         """
         Уменьшение масштаба
         """
-        # Эмулируем событие колеса мыши для уменьшения
-        event = type('Event', (), {'delta': -120, 'num': 5})()
-        self.image_viewer._zoom(event)
+        self.image_viewer.zoom_by(0.9)
     
     def _fit_to_window(self):
         """
         Подгонка изображения под размер окна
         """
-        if self.image_viewer.current_image:
-            self.image_viewer.zoom_factor = 1.0
-            self.image_viewer.display_image(self.image_viewer.current_image)
+        viewer = self.image_viewer
+        if viewer.current_image is None:
+            return
+        # Масштаб уже 1.0 — повторный показ означал бы полный resize
+        # и пересоздание PhotoImage впустую
+        if abs(viewer.zoom_factor - 1.0) < 1e-9:
+            return
+        viewer.zoom_factor = 1.0
+        viewer.display_image(viewer.current_image)
     
     def _update_image_info(self):
         """
         Обновление информации о текущем изображении
         """
         try:
-            self.info_text.config(state='normal')
-            self.info_text.delete(1.0, tk.END)
-            
+            info_str = ""
             if self.current_images:
                 current_file = self.current_images[self.current_image_index]
-                info = self.image_processor.get_image_info(current_file)
+                info = self._get_info_cached(current_file)
                 
                 info_lines = [
-                    f"Файл: {os.path.basename(current_file)}",
+                    f"Файл: {self._current_basenames[self.current_image_index]}",
                     f"Размер файла: {format_file_size(info['file_size'])}",
                     f"Разрешение: {info['dimensions'][0]}x{info['dimensions'][1]}" if info['dimensions'] else "Разрешение: неизвестно",
                     f"Формат: {info['format'] or 'неизвестно'}",
@@ -1003,13 +1367,54 @@ class LogoMasterApp:
                         f"  Отступ: {settings.get('margin', 0)}px",
                     ])
                 
-                self.info_text.insert(tk.END, "\n".join(info_lines))
-            
+                info_str = "\n".join(info_lines)
+
+            # Tk Text перерисовывается на каждый insert — пропускаем
+            # обновление, если текст не изменился
+            if info_str == self._last_info_str:
+                return
+            self._last_info_str = info_str
+
+            # replace() — одна операция над виджетом вместо пары
+            # delete+insert с двумя перерасчетами раскладки
+            self.info_text.config(state='normal')
+            self.info_text.replace('1.0', tk.END, info_str)
             self.info_text.config(state='disabled')
-            
+
         except Exception as e:
             logger.error(f"Ошибка обновления информации об изображении: {e}")
     
+    def _get_info_cached(self, file_path: str) -> dict:
+        """
+        Возвращает информацию об изображении с кэшированием
+
+        Навигация дергает панель информации на каждое нажатие; без кэша
+        каждый показ заново открывал файл ради PIL-заголовка. Ключ
+        включает mtime и размер, поэтому измененный файл перечитывается.
+
+        Args:
+            file_path: Путь к изображению
+
+        Returns:
+            Словарь с информацией об изображении
+        """
+        try:
+            file_stat = os.stat(file_path)
+            key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            return self.image_processor.get_image_info(file_path)
+
+        info = self._info_cache.get(key)
+        if info is None:
+            info = self.image_processor.get_image_info(file_path)
+            self._info_cache[key] = info
+            if len(self._info_cache) > 512:
+                self._info_cache.popitem(last=False)
+        else:
+            self._info_cache.move_to_end(key)
+
+        return info
+
     def _update_navigation_state(self):
         """
         Обновление состояния кнопок навигации
@@ -1036,39 +1441,116 @@ class LogoMasterApp:
         has_logo = self.logo_loaded
         has_processed = bool(self.processed_images)
         is_processing = self.is_processing
-        
-        # Кнопки в toolbar
-        self.load_images_btn.config(state='normal' if not is_processing else 'disabled')
-        self.load_logo_btn.config(state='normal' if not is_processing else 'disabled')
-        self.apply_logo_btn.config(
-            state='normal' if (has_images and has_logo and not is_processing) else 'disabled'
-        )
-        self.batch_btn.config(
-            state='normal' if (has_images and has_logo and not is_processing) else 'disabled'
-        )
-        self.save_btn.config(
-            state='normal' if (has_processed and not is_processing) else 'disabled'
-        )
-        
+        # Флаг ведется в _display_current_image — без цепочки атрибутов
+        # через image_viewer на каждое обновление состояния
+        has_current_image = has_images and self._has_current_image
+
+        ready = 'normal' if not is_processing else 'disabled'
+        can_apply = 'normal' if (has_images and has_logo and not is_processing) else 'disabled'
+        can_save = 'normal' if (has_processed and not is_processing) else 'disabled'
+        can_zoom = 'normal' if has_current_image else 'disabled'
+
+        # Каждый config(state=...) — обращение к Tk; перенастраиваем
+        # только кнопки, состояние которых действительно изменилось
+        new_states = {
+            'load_images_btn': ready,
+            'load_logo_btn': ready,
+            'apply_logo_btn': can_apply,
+            'batch_btn': can_apply,
+            'save_btn': can_save,
+            'zoom_in_btn': can_zoom,
+            'zoom_out_btn': can_zoom,
+            'fit_btn': can_zoom,
+        }
+
+        for name, state in new_states.items():
+            if self._prev_btn_states.get(name) != state:
+                getattr(self, name).config(state=state)
+                self._prev_btn_states[name] = state
+
         # Навигация
         self._update_navigation_state()
-        
-        # Кнопки управления просмотром
-        has_current_image = has_images and self.image_viewer.current_image is not None
-        self.zoom_in_btn.config(state='normal' if has_current_image else 'disabled')
-        self.zoom_out_btn.config(state='normal' if has_current_image else 'disabled')
-        self.fit_btn.config(state='normal' if has_current_image else 'disabled')
     
     def _on_settings_change(self, settings: Dict[str, Any]):
         """
         Обработчик изменения настроек
-        
+
         Args:
             settings: Новые настройки
         """
-        # Можно добавить автоматическое применение настроек
-        # или предварительный просмотр
-        pass
+        # Дебаунс: перетаскивание ползунка дает десятки событий в
+        # секунду, а каждое применение — полный композит. Коалесцируем
+        # всплеск в одно применение через 150 мс тишины
+        if self._apply_pending_id is not None:
+            self.root.after_cancel(self._apply_pending_id)
+            self._apply_pending_id = None
+
+        if not (self.current_images and self.logo_loaded) or self.is_processing:
+            return
+
+        # Автоприменение только для уже обработанного изображения —
+        # первое наложение остается за явной кнопкой
+        current_file = self.current_images[self.current_image_index]
+        if current_file not in self.processed_images:
+            return
+
+        # Мгновенный черновой предпросмотр на уменьшенной копии;
+        # полноразмерный композит произойдет по дебаунсу
+        self._apply_logo_preview(current_file, settings)
+
+        self._apply_pending_id = self.root.after(150, self._fire_pending_apply)
+
+    def _fire_pending_apply(self):
+        """
+        Срабатывание отложенного применения настроек
+        """
+        self._apply_pending_id = None
+        self._apply_logo_to_current()
+
+    def _get_preview_source(self, file_path: str) -> Optional[Image.Image]:
+        """
+        Возвращает уменьшенную копию оригинала для предпросмотра
+
+        Args:
+            file_path: Путь к файлу изображения
+
+        Returns:
+            Превью оригинала или None при ошибке
+        """
+        source = self._preview_sources.get(file_path)
+        if source is None:
+            image = self._load_image_cached(file_path)
+            if image is None:
+                return None
+
+            source = self.image_processor.create_preview(image, (512, 512))
+            self._preview_sources[file_path] = source
+            if len(self._preview_sources) > 8:
+                self._preview_sources.popitem(last=False)
+        else:
+            self._preview_sources.move_to_end(file_path)
+
+        return source
+
+    def _apply_logo_preview(self, current_file: str, settings: Dict[str, Any]):
+        """
+        Быстрый композит на ~512-пиксельной копии для отклика ползунков
+
+        Args:
+            current_file: Путь к текущему файлу
+            settings: Текущие настройки логотипа
+        """
+        try:
+            source = self._get_preview_source(current_file)
+            if source is None:
+                return
+
+            preview = self.image_processor.apply_logo(source, **settings)
+            if preview is not None:
+                self.image_viewer.display_image(preview)
+
+        except Exception as e:
+            logger.debug(f"Ошибка предпросмотра: {e}")
     
     def _on_closing(self):
         """
@@ -1085,9 +1567,18 @@ class LogoMasterApp:
                 else:
                     return
             
-            # Очищаем временные файлы
-            cleanup_temp_directory()
-            
+            # Останавливаем префетч; cancel_futures есть только с 3.9,
+            # на 3.8 просто не ждем — задачи префетча короткие
+            if sys.version_info >= (3, 9):
+                self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._prefetch_pool.shutdown(wait=False)
+
+            # Очищаем временные файлы в фоне — удаление не должно
+            # задерживать закрытие окна
+            threading.Thread(target=cleanup_temp_directory, daemon=True).start()
+
+
             # Сохраняем настройки (если нужно)
             # self._save_settings()
             
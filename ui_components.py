@@ -14,11 +14,34 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable, Optional, Any
 from pathlib import Path
 
 from config import COLORS, FONTS, SIZES, UI_CONFIG, logger
 
+@lru_cache(maxsize=128)
+def _load_icon_photo(path: str, size: int) -> ImageTk.PhotoImage:
+    """
+    Загружает и кэширует иконку как PhotoImage
+
+    Кнопки с одной и той же иконкой делят один пиксмап вместо
+    повторного декодирования и пересэмплирования файла.
+
+    Args:
+        path: Путь к файлу иконки
+        size: Размер стороны иконки в пикселях
+
+    Returns:
+        ImageTk.PhotoImage с иконкой
+    """
+    icon_image = Image.open(path)
+    icon_image = icon_image.resize((size, size), Image.Resampling.LANCZOS)
+    return ImageTk.PhotoImage(icon_image)
+
 class ModernButton(tk.Button):
     """
     Современная кнопка с эффектами наведения и анимацией
@@ -40,8 +63,7 @@ class ModernButton(tk.Button):
         """
         self.style_name = style
         self.icon = icon
-        self.is_hovered = False
-        
+
         # Получаем цвета для стиля
         style_colors = self._get_style_colors(style)
         
@@ -76,48 +98,50 @@ class ModernButton(tk.Button):
         if self.icon:
             self._prepare_icon()
         
-        # Привязываем события
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
+        # Привязываем события: подсветку наведения Tk делает сам через
+        # activebackground/activeforeground, Python-обработчики нужны
+        # только для состояния нажатия
         self.bind('<Button-1>', self._on_click)
         self.bind('<ButtonRelease-1>', self._on_release)
     
+    # Стили общие для всех кнопок — словари строятся один раз при
+    # загрузке модуля, а не при создании каждой кнопки
+    _STYLES = {
+        'primary': {
+            'bg': COLORS['primary'],
+            'fg': COLORS['white'],
+            'hover_bg': COLORS['primary_dark'],
+            'hover_fg': COLORS['white'],
+            'active_bg': COLORS['primary_darker'],
+        },
+        'secondary': {
+            'bg': COLORS['secondary'],
+            'fg': COLORS['text'],
+            'hover_bg': COLORS['secondary_dark'],
+            'hover_fg': COLORS['text'],
+            'active_bg': COLORS['secondary_darker'],
+        },
+        'success': {
+            'bg': COLORS['success'],
+            'fg': COLORS['white'],
+            'hover_bg': '#28a745',
+            'hover_fg': COLORS['white'],
+            'active_bg': '#1e7e34',
+        },
+        'danger': {
+            'bg': COLORS['danger'],
+            'fg': COLORS['white'],
+            'hover_bg': '#c82333',
+            'hover_fg': COLORS['white'],
+            'active_bg': '#bd2130',
+        }
+    }
+
     def _get_style_colors(self, style: str) -> dict:
         """
         Получает цвета для указанного стиля
         """
-        styles = {
-            'primary': {
-                'bg': COLORS['primary'],
-                'fg': COLORS['white'],
-                'hover_bg': COLORS['primary_dark'],
-                'hover_fg': COLORS['white'],
-                'active_bg': COLORS['primary_darker'],
-            },
-            'secondary': {
-                'bg': COLORS['secondary'],
-                'fg': COLORS['text'],
-                'hover_bg': COLORS['secondary_dark'],
-                'hover_fg': COLORS['text'],
-                'active_bg': COLORS['secondary_darker'],
-            },
-            'success': {
-                'bg': COLORS['success'],
-                'fg': COLORS['white'],
-                'hover_bg': '#28a745',
-                'hover_fg': COLORS['white'],
-                'active_bg': '#1e7e34',
-            },
-            'danger': {
-                'bg': COLORS['danger'],
-                'fg': COLORS['white'],
-                'hover_bg': '#c82333',
-                'hover_fg': COLORS['white'],
-                'active_bg': '#bd2130',
-            }
-        }
-        
-        return styles.get(style, styles['primary'])
+        return self._STYLES.get(style, self._STYLES['primary'])
     
     def _prepare_icon(self):
         """
@@ -127,54 +151,32 @@ class ModernButton(tk.Button):
             # Изменяем размер иконки
             icon_size = SIZES['icon_small']
             if isinstance(self.icon, str):
-                # Если передан путь к файлу
-                icon_image = Image.open(self.icon)
+                # Путь к файлу — берем общий кэшированный пиксмап
+                self.icon_photo = _load_icon_photo(self.icon, icon_size)
             else:
-                icon_image = self.icon
-            
-            icon_image = icon_image.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-            self.icon_photo = ImageTk.PhotoImage(icon_image)
-            
+                icon_image = self.icon.resize(
+                    (icon_size, icon_size), Image.Resampling.LANCZOS
+                )
+                self.icon_photo = ImageTk.PhotoImage(icon_image)
+
             # Устанавливаем иконку
             self.config(image=self.icon_photo, compound='left')
-            
+
         except Exception as e:
             logger.error(f"Ошибка подготовки иконки: {e}")
     
-    def _on_enter(self, event):
-        """
-        Обработчик наведения мыши
-        """
-        self.is_hovered = True
-        self.config(
-            bg=self.colors['hover_bg'],
-            fg=self.colors['hover_fg']
-        )
-    
-    def _on_leave(self, event):
-        """
-        Обработчик ухода мыши
-        """
-        self.is_hovered = False
-        self.config(
-            bg=self.colors['bg'],
-            fg=self.colors['fg']
-        )
-    
     def _on_click(self, event):
         """
         Обработчик нажатия
         """
         self.config(bg=self.colors['active_bg'])
-    
+
     def _on_release(self, event):
         """
         Обработчик отпускания
         """
-        if self.is_hovered:
-            self.config(bg=self.colors['hover_bg'])
-        else:
-            self.config(bg=self.colors['bg'])
+        # Подсветку наведения поверх базового цвета Tk наложит сам
+        self.config(bg=self.colors['bg'])
 
 class ImageViewer(tk.Frame):
     """
@@ -193,6 +195,36 @@ class ImageViewer(tk.Frame):
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.is_dragging = False
+
+        # Накопленное смещение перетаскивания между циклами простоя
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._drag_after_id = None
+
+        # Дебаунс масштабирования: тики колеса накапливаются в
+        # _pending_zoom, дорогой resize выполняется один раз за окно
+        self._pending_zoom = 1.0
+        self._zoom_after_id = None
+
+        # Пирамида уменьшенных копий текущего изображения
+        self._pyramid = []
+
+        # Пересэмплирование при масштабировании уходит в фоновый
+        # поток (PIL отпускает GIL); поколение отсекает устаревшие
+        # результаты после нового тика или смены изображения
+        self._resize_pool = ThreadPoolExecutor(max_workers=1)
+        self._resize_generation = 0
+
+        # Элемент canvas переиспользуется через itemconfig; пиксмап —
+        # через PhotoImage.paste, но только когда он наш собственный,
+        # а не общий из _photo_cache
+        self._canvas_image_id = None
+        self._photo_owned = False
+
+        # LRU-кэш готовых PhotoImage: конвертация в Tk-пиксмап делает
+        # попиксельное копирование и заметно тормозит на 4K-изображениях
+        self._photo_cache = OrderedDict()
+        self._photo_cache_limit = 16
         
         self._create_widgets()
         self._bind_events()
@@ -235,7 +267,10 @@ class ImageViewer(tk.Frame):
             bg=COLORS['background']
         )
         
-        self.canvas.create_window(
+        # Окно с меткой создается один раз и дальше только
+        # скрывается/показывается через state — без пересоздания
+        # виджетов на каждую очистку или ошибку
+        self._info_window_id = self.canvas.create_window(
             0, 0,
             window=self.info_label,
             anchor='center'
@@ -258,104 +293,225 @@ class ImageViewer(tk.Frame):
         # Обновление размера
         self.canvas.bind('<Configure>', self._on_canvas_configure)
     
-    def display_image(self, image: Image.Image):
+    def display_image(self, image: Image.Image, cache_key=None):
         """
         Отображает изображение
-        
+
         Args:
-            image: PIL Image для отображения
+            image: PIL Image для отображения; просмотрщик держит
+                ссылку, вызывающий код не должен изменять пиксели
+            cache_key: Ключ для кэша PhotoImage (опционально); при
+                повторном показе того же ключа масштабирование и
+                конвертация в Tk-пиксмап пропускаются
         """
         try:
-            self.current_image = image.copy()
+            # Ссылки достаточно: изображение нигде не мутируется, а
+            # copy() стоил полного прохода по пикселям на каждый показ
+            self.current_image = image
             self.zoom_factor = 1.0
-            
+            self._pending_zoom = 1.0
+            self._resize_generation += 1
+            generation = self._resize_generation
+            if self._zoom_after_id is not None:
+                self.canvas.after_cancel(self._zoom_after_id)
+                self._zoom_after_id = None
+
+            # Пирамиду уменьшенных копий строим лениво при первом тике
+            # зума: на показе и навигации она не нужна, а каскад
+            # reduce(2) для полноразмерного кадра стоит десятки мс
+            self._pyramid = []
+
             # Скрываем информационную метку
-            self.info_label.place_forget()
-            
+            self.canvas.itemconfigure(self._info_window_id, state='hidden')
+
             # Вычисляем размер для отображения
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
-            
+
             if canvas_width <= 1 or canvas_height <= 1:
                 # Canvas еще не отрисован, используем размеры по умолчанию
                 canvas_width = 800
                 canvas_height = 600
-            
+
+            key = None
+            if cache_key is not None:
+                key = (cache_key, canvas_width, canvas_height)
+
+            cached = self._photo_cache.get(key) if key is not None else None
+            if cached is not None:
+                # Быстрый путь: готовый пиксмап ставим сразу
+                self._photo_cache.move_to_end(key)
+                display_image, photo = cached
+                self._commit_display(display_image, photo, key,
+                                     (canvas_width, canvas_height), generation)
+                return
+
+            # Вписывающий resize блокировал цикл событий Tk на
+            # холодном показе; уводим его в фоновый поток
+            self._resize_pool.submit(
+                self._prepare_display, image, key,
+                (canvas_width, canvas_height), generation
+            )
+
+        except Exception as e:
+            logger.error(f"Ошибка отображения изображения: {e}")
+            self.show_error("Ошибка отображения изображения")
+
+    def _prepare_display(self, image: Image.Image, key, canvas_size: tuple,
+                         generation: int):
+        """
+        Фоновая подготовка изображения под размер canvas
+
+        Args:
+            image: Исходное изображение
+            key: Ключ кэша PhotoImage или None
+            canvas_size: Размер canvas (ширина, высота)
+            generation: Номер поколения для отсечения устаревших задач
+        """
+        try:
+            if generation != self._resize_generation:
+                return
+
+            canvas_width, canvas_height = canvas_size
+
             # Масштабируем изображение для помещения в canvas
             img_width, img_height = image.size
             scale_x = canvas_width / img_width
             scale_y = canvas_height / img_height
             scale = min(scale_x, scale_y, 1.0)  # Не увеличиваем больше оригинала
-            
+
             if scale < 1.0:
                 new_width = int(img_width * scale)
                 new_height = int(img_height * scale)
                 display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
             else:
                 display_image = image
-            
-            # Конвертируем в PhotoImage
-            self.current_photo = ImageTk.PhotoImage(display_image)
-            
-            # Очищаем canvas и отображаем изображение
-            self.canvas.delete('all')
-            
+
+            self.canvas.after(
+                0, self._commit_display,
+                display_image, None, key, canvas_size, generation
+            )
+
+        except Exception as e:
+            logger.error(f"Ошибка отображения изображения: {e}")
+
+    def _commit_display(self, display_image: Image.Image, photo, key,
+                        canvas_size: tuple, generation: int):
+        """
+        Установка подготовленного изображения на canvas (Tk-поток)
+
+        Args:
+            display_image: Изображение, вписанное в canvas
+            photo: Готовый PhotoImage из кэша или None
+            key: Ключ кэша PhotoImage или None
+            canvas_size: Размер canvas (ширина, высота)
+            generation: Номер поколения для отсечения устаревших задач
+        """
+        if generation != self._resize_generation:
+            return
+
+        try:
+            canvas_width, canvas_height = canvas_size
+
+            if photo is None:
+                # Конвертируем в PhotoImage
+                photo = ImageTk.PhotoImage(display_image)
+
+                if key is not None:
+                    self._photo_cache[key] = (display_image, photo)
+                    if len(self._photo_cache) > self._photo_cache_limit:
+                        self._photo_cache.popitem(last=False)
+
+            self.current_photo = photo
+
+            # Пиксмап принадлежит кэшу, если попал туда — пастить в
+            # него при зуме нельзя
+            self._photo_owned = key is None
+
+            # Убираем только прежнее изображение: окно с меткой живет
+            # постоянно и управляется через state
+            self.canvas.delete('image')
+
             # Центрируем изображение
             x = canvas_width // 2
             y = canvas_height // 2
-            
-            self.canvas.create_image(x, y, image=self.current_photo, anchor='center', tags='image')
-            
+
+            self._canvas_image_id = self.canvas.create_image(
+                x, y, image=self.current_photo, anchor='center', tags='image'
+            )
+
             # Обновляем область прокрутки
-            self.canvas.configure(scrollregion=self.canvas.bbox('all'))
-            
-            logger.info(f"Изображение отображено: {image.size} -> {display_image.size}")
-            
+            self.canvas.configure(scrollregion=self.canvas.bbox('image'))
+
+            logger.info(f"Изображение отображено: {display_image.size}")
+
         except Exception as e:
             logger.error(f"Ошибка отображения изображения: {e}")
             self.show_error("Ошибка отображения изображения")
     
+    def invalidate_cache(self, cache_key):
+        """
+        Удаляет из кэша PhotoImage все записи с указанным ключом
+
+        Args:
+            cache_key: Ключ, переданный в display_image
+        """
+        for key in [k for k in self._photo_cache if k[0] == cache_key]:
+            del self._photo_cache[key]
+
     def clear(self):
         """
         Очищает просмотрщик
         """
-        self.canvas.delete('all')
+        self.canvas.delete('image')
         self.current_image = None
         self.current_photo = None
         self.zoom_factor = 1.0
-        
-        # Показываем информационную метку
-        canvas_width = self.canvas.winfo_width() or 400
-        canvas_height = self.canvas.winfo_height() or 300
-        
-        self.canvas.create_window(
-            canvas_width // 2, canvas_height // 2,
-            window=self.info_label,
-            anchor='center'
+        self._pending_zoom = 1.0
+        self._pyramid = []
+        self._resize_generation += 1
+        self._canvas_image_id = None
+        self._photo_owned = False
+        if self._zoom_after_id is not None:
+            self.canvas.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = None
+        self._photo_cache.clear()
+
+        # Показываем информационную метку с исходным текстом
+        self.info_label.config(
+            text="Перетащите изображение сюда или используйте кнопку 'Загрузить'",
+            fg=COLORS['text_secondary']
         )
-    
+        self._show_info_window()
+
     def show_error(self, message: str):
         """
         Показывает сообщение об ошибке
         """
-        self.canvas.delete('all')
-        
-        error_label = tk.Label(
-            self.canvas,
+        self.canvas.delete('image')
+        self._canvas_image_id = None
+        self._photo_owned = False
+
+        # Переиспользуем постоянную метку вместо создания нового
+        # Label на каждую ошибку
+        self.info_label.config(
             text=f"Ошибка: {message}",
-            font=FONTS['text'],
-            fg=COLORS['danger'],
-            bg=COLORS['background']
+            fg=COLORS['danger']
         )
-        
+        self._show_info_window()
+
+    def _show_info_window(self):
+        """
+        Показывает окно с информационной меткой по центру canvas
+        """
         canvas_width = self.canvas.winfo_width() or 400
         canvas_height = self.canvas.winfo_height() or 300
-        
-        self.canvas.create_window(
-            canvas_width // 2, canvas_height // 2,
-            window=error_label,
-            anchor='center'
+
+        self.canvas.coords(
+            self._info_window_id,
+            canvas_width // 2, canvas_height // 2
         )
+        self.canvas.itemconfigure(self._info_window_id, state='normal')
     
     def _start_drag(self, event):
         """
@@ -371,70 +527,180 @@ class ImageViewer(tk.Frame):
         Обрабатывает перетаскивание
         """
         if self.is_dragging and self.current_image:
-            dx = event.x - self.drag_start_x
-            dy = event.y - self.drag_start_y
-            
-            self.canvas.move('image', dx, dy)
-            
+            # Несколько событий движения за кадр складываем в один
+            # canvas.move на цикл простоя
+            self._pending_dx += event.x - self.drag_start_x
+            self._pending_dy += event.y - self.drag_start_y
+
             self.drag_start_x = event.x
             self.drag_start_y = event.y
-    
+
+            if self._drag_after_id is None:
+                self._drag_after_id = self.canvas.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """
+        Применяет накопленное смещение перетаскивания
+        """
+        self._drag_after_id = None
+        if self._pending_dx or self._pending_dy:
+            self.canvas.move('image', self._pending_dx, self._pending_dy)
+            self._pending_dx = 0
+            self._pending_dy = 0
+
     def _end_drag(self, event):
         """
         Заканчивает перетаскивание
         """
         self.is_dragging = False
+        self._flush_drag()
+        # Область прокрутки пересчитываем один раз по окончании, а не
+        # на каждое движение
+        self.canvas.configure(scrollregion=self.canvas.bbox('image'))
         self.canvas.config(cursor='')
     
     def _zoom(self, event):
         """
-        Обрабатывает масштабирование
+        Обрабатывает масштабирование колесом мыши
         """
-        if not self.current_image:
-            return
-        
         # Определяем направление прокрутки
         if event.delta > 0 or event.num == 4:
-            scale = 1.1
+            self.zoom_by(1.1)
         else:
-            scale = 0.9
-        
+            self.zoom_by(0.9)
+
+    def zoom_by(self, scale: float):
+        """
+        Масштабирует изображение на заданный множитель
+
+        Args:
+            scale: Множитель масштаба (например, 1.1 или 0.9)
+        """
+        if not self.current_image:
+            return
+
         # Ограничиваем масштаб
-        new_zoom = self.zoom_factor * scale
+        new_zoom = self._pending_zoom * scale
         if new_zoom < 0.1 or new_zoom > 5.0:
             return
-        
-        self.zoom_factor = new_zoom
-        
+
+        self._pending_zoom = new_zoom
+
+        # Коалесцируем всплеск тиков колеса в один resize: каждый тик
+        # стоил полного пересэмплирования оригинала и нового PhotoImage
+        if self._zoom_after_id is not None:
+            self.canvas.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.canvas.after(30, self._apply_zoom)
+
+    def _apply_zoom(self):
+        """
+        Применяет накопленный масштаб: один resize на всплеск тиков
+        """
+        self._zoom_after_id = None
+        if not self.current_image:
+            return
+
+        self.zoom_factor = self._pending_zoom
+
         # Пересоздаем изображение с новым масштабом
         img_width, img_height = self.current_image.size
         new_width = int(img_width * self.zoom_factor)
         new_height = int(img_height * self.zoom_factor)
-        
+
+        # Пирамида строится один раз на изображение, при первом зуме:
+        # каждый уровень вдвое меньше, reduce(2) — дешевое усреднение 2x2
+        if not self._pyramid:
+            self._pyramid = [self.current_image]
+            level = self.current_image
+            while min(level.size) > 128:
+                level = level.reduce(2)
+                self._pyramid.append(level)
+
+        # Берем ближайший сверху уровень пирамиды: при уменьшении это
+        # сокращает объем читаемых пикселей в 4 раза на уровень
+        source = self._pyramid[0]
+        for level in self._pyramid:
+            if level.size[0] >= new_width:
+                source = level
+            else:
+                break
+
+        # Сам resize блокировал цикл событий Tk; уводим его в фоновый
+        # поток, а установку PhotoImage возвращаем через canvas.after
+        self._resize_generation += 1
+        generation = self._resize_generation
+        self._resize_pool.submit(
+            self._resize_worker, source, (new_width, new_height), generation
+        )
+
+    def _resize_worker(self, source: Image.Image, size: tuple, generation: int):
+        """
+        Фоновое пересэмплирование для масштабирования
+
+        Args:
+            source: Уровень пирамиды, из которого масштабируем
+            size: Целевой размер (ширина, высота)
+            generation: Номер поколения для отсечения устаревших задач
+        """
         try:
-            scaled_image = self.current_image.resize(
-                (new_width, new_height), 
-                Image.Resampling.LANCZOS
-            )
+            if generation != self._resize_generation:
+                return
+
+            # BILINEAR для интерактивного масштабирования: визуально
+            # неотличим в движении и в разы дешевле LANCZOS; финальный
+            # рендер (apply_logo, вписывание в окно) остается на LANCZOS
+            scaled_image = source.resize(size, Image.Resampling.BILINEAR)
+            self.canvas.after(0, self._install_scaled, scaled_image, generation)
+
+        except Exception as e:
+            logger.error(f"Ошибка масштабирования: {e}")
+
+    def _install_scaled(self, scaled_image: Image.Image, generation: int):
+        """
+        Устанавливает отмасштабированное изображение на canvas (Tk-поток)
+        """
+        if generation != self._resize_generation:
+            return
+
+        try:
+            # Совпавший по размеру собственный пиксмап переиспользуем
+            # через paste — без выделения нового X-пиксмапа и без
+            # пересоздания элемента canvas
+            if (self._photo_owned
+                    and self.current_photo is not None
+                    and self._canvas_image_id is not None
+                    and self.current_photo.width() == scaled_image.width
+                    and self.current_photo.height() == scaled_image.height):
+                self.current_photo.paste(scaled_image)
+                return
+
             self.current_photo = ImageTk.PhotoImage(scaled_image)
-            
-            # Обновляем изображение на canvas
-            self.canvas.delete('image')
-            
-            # Получаем текущую позицию центра
+            self._photo_owned = True
+
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
-            
-            self.canvas.create_image(
-                canvas_width // 2, canvas_height // 2,
-                image=self.current_photo,
-                anchor='center',
-                tags='image'
+
+            if self._canvas_image_id is not None:
+                # itemconfig вместо delete+create: одно обращение к Tcl
+                self.canvas.itemconfig(self._canvas_image_id, image=self.current_photo)
+            else:
+                self._canvas_image_id = self.canvas.create_image(
+                    canvas_width // 2, canvas_height // 2,
+                    image=self.current_photo,
+                    anchor='center',
+                    tags='image'
+                )
+
+            # Область прокрутки считаем аналитически от центра
+            # элемента и размеров кадра — bbox() обходил бы все
+            # элементы canvas на каждый шаг масштабирования
+            x, y = self.canvas.coords(self._canvas_image_id)
+            half_w = scaled_image.width // 2
+            half_h = scaled_image.height // 2
+            self.canvas.configure(
+                scrollregion=(x - half_w, y - half_h, x + half_w, y + half_h)
             )
-            
-            # Обновляем область прокрутки
-            self.canvas.configure(scrollregion=self.canvas.bbox('all'))
-            
+
         except Exception as e:
             logger.error(f"Ошибка масштабирования: {e}")
     
@@ -446,9 +712,9 @@ class ImageViewer(tk.Frame):
             # Обновляем позицию информационной метки
             canvas_width = event.width
             canvas_height = event.height
-            
+
             self.canvas.coords(
-                self.info_label,
+                self._info_window_id,
                 canvas_width // 2, canvas_height // 2
             )
 
@@ -463,7 +729,9 @@ class ProgressDialog:
         """
         self.parent = parent
         self.cancelled = False
-        
+        self._last_update = 0.0  # монотонное время последней перерисовки
+
+
         # Создаем окно
         self.window = tk.Toplevel(parent)
         self.window.title(title)
@@ -501,13 +769,23 @@ class ProgressDialog:
         )
         self.message_label.pack(pady=(0, 10))
         
-        # Прогресс-бар
-        self.progress = ttk.Progressbar(
+        # Прогресс-бар: узкий Canvas с одним прямоугольником вместо
+        # ttk.Progressbar — присвоение value гоняло перераскладку
+        # элементов темы на каждое обновление
+        self._progress_width = 350
+        self.progress_canvas = tk.Canvas(
             main_frame,
-            mode='determinate',
-            length=350
+            width=self._progress_width,
+            height=16,
+            highlightthickness=0,
+            bg=COLORS['secondary']
         )
-        self.progress.pack(pady=(0, 10))
+        self._progress_bar = self.progress_canvas.create_rectangle(
+            0, 0, 0, 16,
+            fill=COLORS['primary'],
+            outline=''
+        )
+        self.progress_canvas.pack(pady=(0, 10))
         
         # Метка с процентами
         self.percent_label = tk.Label(
@@ -539,22 +817,35 @@ class ProgressDialog:
         """
         if self.cancelled:
             return
-        
+
+        # Не чаще ~30 Гц: на быстрой обработке коллбек приходит на
+        # каждый файл, а перерисовка чаще кадра — выброшенная работа.
+        # Последнее значение (current == total) показываем всегда
+        now = time.monotonic()
+        if now - self._last_update < 0.033 and current < total:
+            return
+        self._last_update = now
+
         try:
-            # Обновляем прогресс-бар
-            progress_value = (current / total) * 100 if total > 0 else 0
-            self.progress['value'] = progress_value
-            
+            # Обновляем прогресс-бар: один вызов coords на обновление
+            fraction = (current / total) if total > 0 else 0
+            progress_value = fraction * 100
+            self.progress_canvas.coords(
+                self._progress_bar,
+                0, 0, int(self._progress_width * fraction), 16
+            )
+
             # Обновляем процент
             self.percent_label.config(text=f"{progress_value:.1f}%")
-            
+
             # Обновляем сообщение если передано
             if message:
                 self.message_label.config(text=message)
-            
-            # Обновляем интерфейс
-            self.window.update()
-            
+
+            # update_idletasks перерисовывает без выкачивания очереди
+            # событий: update() мог реентерабельно обработать ввод
+            self.window.update_idletasks()
+
         except tk.TclError:
             # Окно было закрыто
             self.cancelled = True
@@ -598,7 +889,8 @@ class SettingsPanel(tk.Frame):
         
         self.on_change_callback = on_change_callback
         self.settings = {}
-        
+        self._pending_cb = None  # запланированный after_idle-вызов callback'а
+
         self._create_widgets()
     
     def _create_widgets(self):
@@ -644,7 +936,7 @@ class SettingsPanel(tk.Frame):
         label.pack(anchor='w')
         
         self.position_var = tk.StringVar(value="bottom_right")
-        
+
         positions = [
             ("Верх слева", "top_left"),
             ("Верх по центру", "top_center"),
@@ -656,21 +948,35 @@ class SettingsPanel(tk.Frame):
             ("Низ по центру", "bottom_center"),
             ("Низ справа", "bottom_right"),
         ]
-        
-        for text, value in positions:
-            rb = tk.Radiobutton(
-                frame,
-                text=text,
-                variable=self.position_var,
-                value=value,
-                font=FONTS['small'],
-                fg=COLORS['text'],
-                bg=COLORS['background'],
-                selectcolor=COLORS['secondary'],
-                command=self._on_setting_change
-            )
-            rb.pack(anchor='w')
-    
+
+        # Один Combobox вместо девяти Radiobutton: девять виджетов с
+        # обработчиками заметно удлиняли создание панели
+        self._position_label_by_value = {value: text for text, value in positions}
+        self._position_value_by_label = {text: value for text, value in positions}
+
+        self._position_display = tk.StringVar(
+            value=self._position_label_by_value[self.position_var.get()]
+        )
+        combo = ttk.Combobox(
+            frame,
+            textvariable=self._position_display,
+            values=[text for text, _ in positions],
+            state='readonly',
+            font=FONTS['small'],
+            width=20
+        )
+        combo.pack(anchor='w')
+        combo.bind('<<ComboboxSelected>>', self._on_position_selected)
+
+    def _on_position_selected(self, event=None):
+        """
+        Обработчик выбора позиции в выпадающем списке
+        """
+        self.position_var.set(
+            self._position_value_by_label[self._position_display.get()]
+        )
+        self._on_setting_change()
+
     def _create_size_section(self):
         """
         Создает секцию настройки размера
@@ -817,7 +1123,19 @@ class SettingsPanel(tk.Frame):
         self.size_label.config(text=f"{int(self.size_var.get() * 100)}%")
         self.opacity_label.config(text=f"{int(self.opacity_var.get() * 100)}%")
         self.margin_label.config(text=f"{self.margin_var.get()}px")
-        
+
+        # Scale дергает command на каждый пиксель перетаскивания, а
+        # callback запускает тяжелую перерисовку предпросмотра —
+        # коалесцируем всплеск в один вызов на цикл простоя
+        if self._pending_cb is None:
+            self._pending_cb = self.after_idle(self._fire_change_callback)
+
+    def _fire_change_callback(self):
+        """
+        Отложенный вызов callback'а изменения настроек
+        """
+        self._pending_cb = None
+
         # Собираем текущие настройки
         self.settings = {
             'position': self.position_var.get(),
@@ -825,7 +1143,7 @@ class SettingsPanel(tk.Frame):
             'opacity': self.opacity_var.get(),
             'margin': self.margin_var.get(),
         }
-        
+
         # Вызываем callback если установлен
         if self.on_change_callback:
             self.on_change_callback(self.settings)
@@ -834,7 +1152,14 @@ class SettingsPanel(tk.Frame):
         """
         Возвращает текущие настройки
         """
-        return self.settings.copy()
+        # Читаем переменные напрямую: отложенный callback мог еще не
+        # успеть пересобрать self.settings
+        return {
+            'position': self.position_var.get(),
+            'size': self.size_var.get(),
+            'opacity': self.opacity_var.get(),
+            'margin': self.margin_var.get(),
+        }
     
     def set_settings(self, settings: dict):
         """
@@ -845,6 +1170,9 @@ class SettingsPanel(tk.Frame):
         """
         if 'position' in settings:
             self.position_var.set(settings['position'])
+            label = self._position_label_by_value.get(settings['position'])
+            if label is not None:
+                self._position_display.set(label)
         if 'size' in settings:
             self.size_var.set(settings['size'])
         if 'opacity' in settings: